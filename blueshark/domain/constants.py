@@ -12,7 +12,7 @@ Description:
     solver implementations.
 """
 
-from math import pi
+from math import pi, sqrt
 from blueshark.domain.definitions import Units
 
 PRECISION: int = 12
@@ -42,6 +42,17 @@ PI = pi
 TWO_PI = 2 * pi
 # Precompute π and 2π to avoid repeated calculations.
 
+SQRT3 = sqrt(3)
+HALF_SQRT3 = 0.5 * SQRT3
+# Precompute √3 and √3/2 for the three-phase (Clarke) transforms.
+
+NUMERIC_TYPES = (float, int)
+# Value types accepted by the numeric input checks.
+
+DEG_TO_RAD = pi / 180
+RAD_TO_DEG = 180 / pi
+# Degree/radian factors, replace math.radians/degrees calls in hot paths.
+
 CONVERSION_TO_METERS = {
     Units.MICROMETERS: 1e-6,
     Units.MILLIMETER: 1e-3,
@@ -49,3 +60,12 @@ CONVERSION_TO_METERS = {
     Units.METER: 1.0,
 }
 # Conversion factors from each unit to meters.
+
+GEOMETRY_CACHE_SIZE: int = 4096
+# Maximum number of memoized area/centroid results kept per kernel cache.
+
+COMMUTATION_CACHE_SIZE: int = 64
+# Maximum number of memoized commutation profiles (one per drive setting).
+
+COMMUTATION_RESEED: int = 64
+# Samples between exact cos/sin evaluations in the commutation recurrence.
@@ -9,35 +9,75 @@ Description:
     the area of geometric shapes for analysis.
 """
 
-from typing import List, Tuple
-from math import radians
+from typing import Callable, Dict, List, Tuple
+from math import fsum
+from operator import add, mul, sub
 
-from blueshark.domain.constants import PRECISION, PI
+from blueshark.domain.constants import PRECISION, PI, DEG_TO_RAD
 from blueshark.domain.definitions import Geometry, ShapeType
+from blueshark.domain.geometry.cache import cached_kernel, freeze_points
 
+_HALF_DEG_TO_RAD = 0.5 * DEG_TO_RAD
+# Folds the sector area's 1/2 factor into the degree conversion
 
-def _area_polygon(points: List[Tuple[float, float]]) -> float:
+
+def _polygon_moments(
+    points: Tuple[Tuple[float, float], ...],
+    high_precision: bool = False
+) -> Tuple[float, float, float]:
     """
-    Calculate the area of a polygon with n points using the shoelace formula.
+    Calculate the signed area and first moments of a polygon using the
+    shoelace formula. Shared by the area and graphical centroid
+    calculations, so a memoized call serves both with one traversal.
 
     Args:
-        points: List of (x, y) coordinates defining the polygon vertices.
+        points: Sequence of (x, y) coordinates defining the polygon vertices.
+        high_precision: Accumulate with math.fsum to avoid cancellation
+            on large or far-from-origin polygons; Default False
 
     Returns:
-        float: Area of the polygon.
+        Tuple (signed_area, x_moment, y_moment). The centroid is
+        (x_moment, y_moment) / (6 * signed_area).
     """
     if not points or len(points) < 3:
         raise ValueError("Polygon must have at least 3 points")
 
     # Reference: https://en.wikipedia.org/wiki/Shoelace_formula
-    area = 0.0
-    number_points = len(points)
-    for i in range(number_points):
-        x1, y1 = points[i]
-        x2, y2 = points[(i + 1) % number_points]
-        area += x1 * y2 - x2 * y1
+    # Per-edge cross products against the rolled coordinates, evaluated
+    # with map/sum so the per-vertex loop runs in C instead of bytecode.
+    xs, ys = zip(*points)
+    xs_next = xs[1:] + xs[:1]
+    ys_next = ys[1:] + ys[:1]
+    cross = list(map(sub, map(mul, xs, ys_next), map(mul, xs_next, ys)))
+
+    total = fsum if high_precision else sum
+    signed_area = 0.5 * total(cross)
+    x_moment = total(map(mul, map(add, xs, xs_next), cross))
+    y_moment = total(map(mul, map(add, ys, ys_next), cross))
 
-    return abs(area) / 2
+    return signed_area, x_moment, y_moment
+
+
+def _area_polygon(
+    points: List[Tuple[float, float]],
+    high_precision: bool = False
+) -> float:
+    """
+    Calculate the area of a polygon with n points using the shoelace formula.
+
+    Args:
+        points: List of (x, y) coordinates defining the polygon vertices.
+        high_precision: Accumulate with math.fsum; Default False
+
+    Returns:
+        float: Area of the polygon.
+    """
+    signed_area, _, _ = cached_kernel(
+        _polygon_moments,
+        freeze_points(points),
+        high_precision
+    )
+    return abs(signed_area)
 
 
 def _area_circle(radius: float) -> float:
@@ -52,7 +92,7 @@ def _area_circle(radius: float) -> float:
     """
     if radius is None:
         raise ValueError("Circle radius is required")
-    return PI * radius ** 2
+    return PI * radius * radius
 
 
 def _area_annulus_sector(
@@ -78,9 +118,8 @@ def _area_annulus_sector(
             raise ValueError("All annulus sector parameters are required")
 
     # Reference: https://en.wikipedia.org/wiki/Annulus_(mathematics)
-    angle_rad = radians(abs(end_angle - start_angle))
-    area = 0.5 * angle_rad * (r_outer ** 2 - r_inner ** 2)
-    return area
+    half_angle_rad = _HALF_DEG_TO_RAD * abs(end_angle - start_angle)
+    return half_angle_rad * (r_outer * r_outer - r_inner * r_inner)
 
 
 def _area_annulus_circle(
@@ -101,15 +140,82 @@ def _area_annulus_circle(
         raise ValueError("Outer and inner radii are required for annulus")
 
     # Reference: https://en.wikipedia.org/wiki/Annulus_(mathematics)
-    return PI * (r_outer ** 2 - r_inner ** 2)
+    return PI * (r_outer * r_outer - r_inner * r_inner)
 
 
-def calculate_area(geometry: Geometry) -> float:
+def _unique_edge_points(
+    edge_points: Tuple[Tuple[float, float], ...]
+) -> Tuple[Tuple[float, float], ...]:
+    """
+    Removes duplicate edge points while keeping their order.
+
+    Args:
+        edge_points: Flattened (start, end, start, end, ...) edge points.
+
+    Returns:
+        Tuple of unique (x, y) points, in first-seen order.
+    """
+    return tuple(dict.fromkeys(edge_points))
+
+
+def _hybrid_points(geometry: Geometry) -> Tuple[Tuple[float, float], ...]:
+    """
+    Collects the vertices of a hybrid shape from its edge points.
+
+    The deduplicated vertices are memoized on the edge points, so the
+    area and centroid of the same hybrid shape share one pass.
+
+    Args:
+        geometry (Geometry): Hybrid geometry with an 'edges' list.
+
+    Returns:
+        Tuple of unique (x, y) edge points, in first-seen order.
+    """
+    edge_points = tuple(
+        point
+        for edge in geometry["edges"]
+        for point in (edge["start"], edge["end"])
+    )
+    return cached_kernel(_unique_edge_points, edge_points)
+
+
+_AREA_DISPATCH: Dict[ShapeType, Callable[[Geometry, bool], float]] = {
+    ShapeType.POLYGON: lambda g, hp: _area_polygon(g.get("points"), hp),
+    ShapeType.RECTANGLE: lambda g, hp: _area_polygon(g.get("points"), hp),
+    ShapeType.CIRCLE: lambda g, _: cached_kernel(
+        _area_circle,
+        g.get("radius")
+    ),
+    ShapeType.ANNULUS_SECTOR: lambda g, _: cached_kernel(
+        _area_annulus_sector,
+        g.get("radius_outer"),
+        g.get("radius_inner"),
+        g.get("start_angle"),
+        g.get("end_angle")
+    ),
+    ShapeType.ANNULUS_CIRCLE: lambda g, _: cached_kernel(
+        _area_annulus_circle,
+        g.get("radius_outer"),
+        g.get("radius_inner")
+    ),
+    # Approximate area using all edge points
+    ShapeType.HYBRID: lambda g, hp: _area_polygon(_hybrid_points(g), hp),
+}
+# Per-shape area handlers, one dict lookup instead of a match per call.
+# The precision flag only affects point-based shapes.
+
+
+def calculate_area(
+    geometry: Geometry,
+    high_precision: bool = False
+) -> float:
     """
     Calculate the area of a geometric element from its parameters.
 
     Args:
         geometry (Geometry): Dictionary describing shape and dimensions.
+        high_precision: Use compensated (math.fsum) summation for
+            polygon, rectangle and hybrid shapes; Default False
 
     Returns:
         float: Area of the element.
@@ -121,48 +227,8 @@ def calculate_area(geometry: Geometry) -> float:
         raise ValueError("Geometry dictionary must contain a 'shape' key")
 
     shape = geometry["shape"]
+    handler = _AREA_DISPATCH.get(shape)
+    if handler is None:
+        raise NotImplementedError(f"Shape '{shape}' not supported")
 
-    match shape:
-        case ShapeType.POLYGON | ShapeType.RECTANGLE:
-            points = geometry.get("points")
-            area = _area_polygon(points)
-
-        case ShapeType.CIRCLE:
-            radius = geometry.get("radius")
-            area = _area_circle(radius)
-
-        case ShapeType.ANNULUS_SECTOR:
-            area = _area_annulus_sector(
-                geometry.get("radius_outer"),
-                geometry.get("radius_inner"),
-                geometry.get("start_angle"),
-                geometry.get("end_angle")
-            )
-
-        case ShapeType.ANNULUS_CIRCLE:
-            area = _area_annulus_circle(
-                geometry.get("radius_outer"),
-                geometry.get("radius_inner")
-            )
-
-        case ShapeType.HYBRID:
-            # Approximate area using all edge points
-            points = []
-            for edge in geometry["edges"]:
-                points.append(edge["start"])
-                points.append(edge["end"])
-
-            # Remove duplicates while keeping order
-            seen = set()
-            unique_points = []
-            for pt in points:
-                if pt not in seen:
-                    unique_points.append(pt)
-                    seen.add(pt)
-
-            area = _area_polygon(unique_points)
-
-        case _:
-            raise NotImplementedError(f"Shape '{shape}' not supported")
-
-    return round(area, PRECISION)
+    return round(handler(geometry, high_precision), PRECISION)
@@ -0,0 +1,64 @@
+"""
+Filename: cache.py
+Author: William Bowley
+Version: 1.4
+Date: 2026-10-15
+
+Description:
+    Memoization helpers for the pure geometry kernels.
+
+    Results are keyed on the kernel and the values of its
+    arguments (not the identity of the geometry dictionary),
+    so mutating a geometry between calls is always safe.
+"""
+
+from functools import lru_cache
+from typing import Any, Callable
+
+from blueshark.domain.constants import GEOMETRY_CACHE_SIZE
+
+
+@lru_cache(maxsize=GEOMETRY_CACHE_SIZE)
+def _cached_call(kernel: Callable[..., Any], args: tuple) -> Any:
+    """
+    Evaluates the kernel through the shared LRU cache.
+    """
+    return kernel(*args)
+
+
+def freeze_points(points: Any) -> Any:
+    """
+    Converts a list of points to a tuple so it can be used as a cache key.
+    Any other value is returned unchanged.
+
+    Args:
+        points: List of (x, y) coordinates or any other value.
+    """
+    if isinstance(points, list):
+        return tuple(points)
+    return points
+
+
+def cached_kernel(kernel: Callable[..., Any], *args: Any) -> Any:
+    """
+    Evaluates kernel(*args), reusing the result of a previous call
+    with equal arguments. Falls back to a direct call when the
+    arguments are not hashable.
+
+    Args:
+        kernel: Pure function of its arguments.
+        *args: Arguments passed to the kernel.
+    """
+    try:
+        hash(args)
+    except TypeError:
+        return kernel(*args)
+
+    return _cached_call(kernel, args)
+
+
+def clear_geometry_cache() -> None:
+    """
+    Drops all memoized geometry results.
+    """
+    _cached_call.cache_clear()
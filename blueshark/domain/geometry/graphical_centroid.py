@@ -13,10 +13,29 @@ Description:
         area-weighted or mass centroid.
 """
 
-from math import cos, sin, radians
+from typing import Callable
+from math import cos, sin, fmod
 
-from blueshark.domain.constants import PRECISION
+from blueshark.domain.constants import PRECISION, DEG_TO_RAD
 from blueshark.domain.definitions import ShapeType, Geometry
+from blueshark.domain.geometry.area import _hybrid_points, _polygon_moments
+from blueshark.domain.geometry.cache import cached_kernel, freeze_points
+
+
+def _wrap_degrees(angle: float) -> float:
+    """
+    Wraps an angle in degrees to the range [0, 360).
+
+    Args:
+        angle: Angle in degrees.
+
+    Returns:
+        float: Equivalent angle within [0, 360).
+    """
+    angle = fmod(angle, 360.0)
+    if angle < 0:
+        angle += 360.0
+    return angle
 
 
 def _polygon(points: list[tuple[float, float]]) -> tuple[float, float]:
@@ -29,20 +48,12 @@ def _polygon(points: list[tuple[float, float]]) -> tuple[float, float]:
     Returns:
         Tuple (x, y) of graphical centroid.
     """
-    num_points = len(points)
-    signed_area = 0
-    cx = 0
-    cy = 0
-
-    for i in range(num_points):
-        x0, y0 = points[i]
-        x1, y1 = points[(i + 1) % num_points]
-        a = (x0 * y1) - (x1 * y0)
-        signed_area += a
-        cx += (x0 + x1) * a
-        cy += (y0 + y1) * a
-
-    signed_area *= 0.5
+    # Same arguments as _area_polygon, so both share one cache entry
+    signed_area, cx, cy = cached_kernel(
+        _polygon_moments,
+        freeze_points(points),
+        False
+    )
 
     if signed_area == 0:
         msg = (
@@ -112,11 +123,11 @@ def _annulus_sector(
     Returns:
         Tuple (x, y) of graphical centroid.
     """
-    start_angle %= 360
-    end_angle %= 360
-    angle_delta = (end_angle - start_angle) % 360
-    angle_bisector = (start_angle + angle_delta / 2) % 360
-    angle = radians(angle_bisector)
+    start_angle = _wrap_degrees(start_angle)
+    end_angle = _wrap_degrees(end_angle)
+    angle_delta = _wrap_degrees(end_angle - start_angle)
+    angle_bisector = _wrap_degrees(start_angle + angle_delta / 2)
+    angle = angle_bisector * DEG_TO_RAD
     radius = (r_outer + r_inner) / 2
 
     x_coord = radius * cos(angle) + center[0]
@@ -125,6 +136,32 @@ def _annulus_sector(
     return (x_coord, y_coord)
 
 
+_CENTROID_DISPATCH: dict[
+    ShapeType, Callable[[Geometry], tuple[float, float]]
+] = {
+    ShapeType.POLYGON: lambda g: _polygon(g.get("points")),
+    ShapeType.RECTANGLE: lambda g: _polygon(g.get("points")),
+    ShapeType.CIRCLE: lambda g: _circle(g.get("center")),
+    ShapeType.ANNULUS_CIRCLE: lambda g: cached_kernel(
+        _annulus_circle,
+        g.get("center"),
+        g.get("radius_outer"),
+        g.get("radius_inner")
+    ),
+    ShapeType.ANNULUS_SECTOR: lambda g: cached_kernel(
+        _annulus_sector,
+        g.get("center"),
+        g.get("radius_outer"),
+        g.get("radius_inner"),
+        g.get("start_angle"),
+        g.get("end_angle")
+    ),
+    # Approximate graphical centroid using all edge points
+    ShapeType.HYBRID: lambda g: _polygon(_hybrid_points(g)),
+}
+# Per-shape centroid handlers, one dict lookup instead of a match per call.
+
+
 def centroid_point(geometry: Geometry) -> tuple[float, float]:
     """
     Returns the graphical centroid of a shape for rendering.
@@ -146,48 +183,9 @@ def centroid_point(geometry: Geometry) -> tuple[float, float]:
         raise ValueError("Geometry dictionary must contain a 'shape' key")
 
     shape = geometry.get("shape")
+    handler = _CENTROID_DISPATCH.get(shape)
+    if handler is None:
+        raise NotImplementedError(f"Shape '{shape}' not supported")
 
-    match shape:
-        case ShapeType.POLYGON | ShapeType.RECTANGLE:
-            coords = _polygon(geometry.get("points"))
-
-        case ShapeType.CIRCLE:
-            coords = _circle(geometry.get("center"))
-
-        case ShapeType.ANNULUS_CIRCLE:
-            coords = _annulus_circle(
-                geometry.get("center"),
-                geometry.get("radius_outer"),
-                geometry.get("radius_inner")
-            )
-
-        case ShapeType.ANNULUS_SECTOR:
-            coords = _annulus_sector(
-                geometry.get("center"),
-                geometry.get("radius_outer"),
-                geometry.get("radius_inner"),
-                geometry.get("start_angle"),
-                geometry.get("end_angle")
-            )
-
-        case ShapeType.HYBRID:
-            # Approximate graphical centroid using all edge points
-            points = []
-            for edge in geometry["edges"]:
-                points.append(edge["start"])
-                points.append(edge["end"])
-
-            # Remove duplicates while keeping order
-            seen = set()
-            unique_points = []
-            for pt in points:
-                if pt not in seen:
-                    unique_points.append(pt)
-                    seen.add(pt)
-
-            coords = _polygon(unique_points)
-
-        case _:
-            raise NotImplementedError(f"Shape '{shape}' not supported")
-
-    return tuple(round(x, PRECISION) for x in coords)
+    x_coord, y_coord = handler(geometry)
+    return (round(x_coord, PRECISION), round(y_coord, PRECISION))
@@ -9,11 +9,14 @@ Description:
     for renderers and solvers.
 """
 
-from math import atan2, hypot, cos, sin
-from blueshark.domain.constants import PI, PRECISION, EPSILON
+from typing import Callable
+from math import hypot, cos, sin, inf, isinf
+from blueshark.domain.constants import EPSILON, NUMERIC_TYPES, PRECISION
 from blueshark.domain.definitions import Geometry, ShapeType
 from blueshark.domain.geometry.graphical_centroid import _polygon
-from blueshark.domain.geometry.validation import validate_shape
+from blueshark.domain.geometry.validation import (
+    _POINT_SEQUENCES, validate_shape
+)
 
 
 def _check_point(
@@ -21,19 +24,20 @@ def _check_point(
     point: tuple[float, float]
 ) -> None:
     """
-    Check if a given tuple contains exactly two
+    Check if a given tuple (or list) contains exactly two
     floating-point numbers. Raises an error if not.
     """
     # Type test
-    if not isinstance(point, tuple):
-        raise TypeError(f"'{name}' must be a tuple, got: {point}")
+    if not isinstance(point, _POINT_SEQUENCES):
+        raise TypeError(f"'{name}' must be a tuple or list, got: {point}")
 
     # Range test
     if len(point) != 2:
         raise ValueError(f"'{name}' must be length two, got: {point}")
 
-    # Type test
-    if not all(isinstance(coord, (float, int)) for coord in point):
+    # Type test, unpacked to avoid a generator per call
+    x, y = point
+    if not (isinstance(x, NUMERIC_TYPES) and isinstance(y, NUMERIC_TYPES)):
         msg = f"Tuple '{name}' must contain only float or int, got {point}"
         raise ValueError(msg)
 
@@ -53,16 +57,11 @@ def _scale_polygon(
 
     # Assumes that the centroid is geometric center
     x0, y0 = _polygon(points)
-    print(x0, y0)
-
-    scaled_points = []
-    for x1, y1 in points:
-        scaled_points.append((
-            x0 + factor * (x1 - x0),
-            y0 + factor * (y1 - y0)
-        ))
 
-    return scaled_points
+    return [
+        (x0 + factor * (x1 - x0), y0 + factor * (y1 - y0))
+        for x1, y1 in points
+    ]
 
 
 def mid_points_line(
@@ -87,8 +86,7 @@ def mid_points_line(
     x1, y1 = point1
     x2, y2 = point2
 
-    coords = ((x1 + x2) / 2, (y1 + y2) / 2)
-    return tuple(round(x, PRECISION) for x in coords)
+    return (round((x1 + x2) / 2, PRECISION), round((y1 + y2) / 2, PRECISION))
 
 
 def mid_points_arc(
@@ -119,19 +117,35 @@ def mid_points_arc(
     end_x, end_y = end_point
     center_x, center_y = center
 
-    start_angle = atan2(start_y - center_y, start_x - center_x)
-    end_angle = atan2(end_y - center_y, end_x - center_x)
-    mid_angle = (start_angle + end_angle) / 2
+    start_dx = start_x - center_x
+    start_dy = start_y - center_y
+    end_dx = end_x - center_x
+    end_dy = end_y - center_y
+
+    # The sum of the two unit radii points along the bisector of the
+    # shorter arc, which avoids both atan2 calls and the wrap branch
+    radius = hypot(start_dx, start_dy)
+    end_radius = hypot(end_dx, end_dy)
 
-    if abs(end_angle - start_angle) > PI:
-        mid_angle += PI
+    if radius < EPSILON or end_radius < EPSILON:
+        msg = f"Arc start and end points must not lie on the center {center}"
+        raise ValueError(msg)
+
+    sum_x = start_dx / radius + end_dx / end_radius
+    sum_y = start_dy / radius + end_dy / end_radius
+    norm = hypot(sum_x, sum_y)
 
-    radius = hypot(start_x - center_x, start_y - center_y)
-    mid_x = center_x + radius * cos(mid_angle)
-    mid_y = center_y + radius * sin(mid_angle)
+    if norm > EPSILON:
+        mid_x = center_x + radius * sum_x / norm
+        mid_y = center_y + radius * sum_y / norm
+    else:
+        # Points are opposite each other (half circle), FEMM draws arcs
+        # counter-clockwise so the midpoint is the start radius rotated
+        # by +90 degrees
+        mid_x = center_x - start_dy
+        mid_y = center_y + start_dx
 
-    coords = (mid_x, mid_y)
-    return tuple(round(x, PRECISION) for x in coords)
+    return (round(mid_x, PRECISION), round(mid_y, PRECISION))
 
 
 def find_arc_center(
@@ -167,8 +181,11 @@ def find_arc_center(
     if hypot(x1 - x0, y1 - y0) < EPSILON:
         raise ValueError("Start and end points must be distinct.")
 
-    denom_x = cos(end_angle) - cos(start_angle)
-    denom_y = sin(end_angle) - sin(start_angle)
+    # Start angle trig is reused for the center, evaluate it once
+    cos_start = cos(start_angle)
+    sin_start = sin(start_angle)
+    denom_x = cos(end_angle) - cos_start
+    denom_y = sin(end_angle) - sin_start
 
     # Identical angles or 180 degrees apart.
     if abs(denom_x) < EPSILON and abs(denom_y) < EPSILON:
@@ -180,29 +197,61 @@ def find_arc_center(
     if abs(denom_x) > EPSILON:
         radius_from_x = (x1 - x0) / denom_x
     else:
-        radius_from_x = float('inf')
+        radius_from_x = inf
 
     if abs(denom_y) > EPSILON:
         radius_from_y = (y1 - y0) / denom_y
     else:
-        radius_from_y = float('inf')
+        radius_from_y = inf
 
     # Check for consistency between the two radius calculations
     if (
-        radius_from_x != float('inf') and
-        radius_from_y != float('inf') and
+        not isinf(radius_from_x) and
+        not isinf(radius_from_y) and
         abs(radius_from_x - radius_from_y) > EPSILON
     ):
         msg = "Angles or points do not form a consistent arc."
         raise ValueError(msg)
 
-    radius = radius_from_x if radius_from_x != float('inf') else radius_from_y
+    radius = radius_from_y if isinf(radius_from_x) else radius_from_x
 
     # Calculate center using the start point and angle
-    cx = x0 - radius * cos(start_angle)
-    cy = y0 - radius * sin(start_angle)
+    cx = x0 - radius * cos_start
+    cy = y0 - radius * sin_start
 
-    return tuple(round(coord, PRECISION) for coord in (cx, cy))
+    return (round(cx, PRECISION), round(cy, PRECISION))
+
+
+def _scale_points(shape: Geometry, factor: float) -> None:
+    """
+    Scales the points of a polygon or rectangle about its centroid.
+    """
+    shape["points"] = _scale_polygon(shape["points"], factor)
+
+
+def _scale_radius(shape: Geometry, factor: float) -> None:
+    """
+    Scales the radius of a circle.
+    """
+    shape["radius"] = factor * shape["radius"]
+
+
+def _scale_radii(shape: Geometry, factor: float) -> None:
+    """
+    Scales the inner and outer radius of an annulus.
+    """
+    shape["radius_outer"] = factor * shape["radius_outer"]
+    shape["radius_inner"] = factor * shape["radius_inner"]
+
+
+_SCALE_DISPATCH: dict[ShapeType, Callable[[Geometry, float], None]] = {
+    ShapeType.POLYGON: _scale_points,
+    ShapeType.RECTANGLE: _scale_points,
+    ShapeType.CIRCLE: _scale_radius,
+    ShapeType.ANNULUS_CIRCLE: _scale_radii,
+    ShapeType.ANNULUS_SECTOR: _scale_radii,
+}
+# Per-shape scaling handlers, hybrid shapes are not supported.
 
 
 def scale_geometry(
@@ -222,22 +271,10 @@ def scale_geometry(
     validate_shape(shape)
 
     shape_type = shape.get("shape")
-    match shape_type:
-        case ShapeType.POLYGON | ShapeType.RECTANGLE:
-            shape["points"] = _scale_polygon(
-                shape["points"],
-                factor
-            )
-
-        case ShapeType.CIRCLE:
-            shape["radius"] = factor * shape["radius"]
-
-        case ShapeType.ANNULUS_CIRCLE | ShapeType.ANNULUS_SECTOR:
-            shape["radius_outer"] = factor * shape["radius_outer"]
-            shape["radius_inner"] = factor * shape["radius_inner"]
-
-        case _:
-            msg = f"Shape '{shape_type}' not supported for scaling"
-            raise NotImplementedError(msg)
+    handler = _SCALE_DISPATCH.get(shape_type)
+    if handler is None:
+        msg = f"Shape '{shape_type}' not supported for scaling"
+        raise NotImplementedError(msg)
 
+    handler(shape, factor)
     return shape
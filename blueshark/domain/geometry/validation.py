@@ -9,10 +9,15 @@ Description:
     input primitive shapes for all renderers.
 """
 
-import logging
+from itertools import chain
+from typing import Callable
 
+from blueshark.domain.constants import NUMERIC_TYPES
 from blueshark.domain.definitions import Connectors, Geometry, ShapeType
 
+_POINT_SEQUENCES = (tuple, list)
+# Accepted point types for point checks (also used by utils).
+
 
 def _validate_polygon(points: list[tuple[float, float]]) -> None:
     """
@@ -23,33 +28,41 @@ def _validate_polygon(points: list[tuple[float, float]]) -> None:
     """
     if points is None:
         msg = "Points must be defined to draw a polygon"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
     if not isinstance(points, list):
         msg = f"Points must be a list, got {type(points).__name__}"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
     if len(points) < 3:
         msg = "At least 3 points required for a polygon"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
+    # Whole-list pass over exact types and lengths, done with map/set so
+    # typical float/int tuples never reach the per-vertex loop below.
+    # Subclasses of the accepted types take the slow path.
+    if (
+        set(map(type, points)).issubset(_POINT_SEQUENCES)
+        and set(map(len, points)) == {2}
+        and set(map(type, chain.from_iterable(points))).issubset(NUMERIC_TYPES)
+    ):
+        return
+
+    # Slow path: locate the offending vertex for the error message
     for i, pt in enumerate(points):
-        if not isinstance(pt, tuple) or len(pt) != 2:
+        if not isinstance(pt, _POINT_SEQUENCES) or len(pt) != 2:
             msg = (
-                f"Point at index {i} must be a tuple of 2 elements, got {pt}"
+                f"Point at index {i} must be a tuple or list "
+                f"of 2 elements, got {pt}"
             )
-            logging.error(msg)
             raise ValueError(f"{__name__}: {msg}")
 
-        if not all(isinstance(c, (int, float)) for c in pt):
+        x, y = pt
+        if not (isinstance(x, NUMERIC_TYPES) and isinstance(y, NUMERIC_TYPES)):
             msg = (
                 f"Point coordinates at index {i} "
                 f"must be int or float, got {pt}"
             )
-            logging.error(msg)
             raise ValueError(f"{__name__}: {msg}")
 
 
@@ -63,35 +76,33 @@ def _validate_circle(radius: float, center: tuple[float, float]) -> None:
     """
     if radius is None or center is None:
         msg = "Circle radius and center must be defined"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
-    if not isinstance(radius, (float, int)):
+    if not isinstance(radius, NUMERIC_TYPES):
         msg = (
             "Circle radius must be float or int, "
             f"got {type(radius).__name__}"
         )
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
-    if not isinstance(center, tuple):
-        msg = f"Circle center must be a tuple, got {type(center).__name__}"
-        logging.error(msg)
+    if not isinstance(center, _POINT_SEQUENCES):
+        msg = (
+            "Circle center must be a tuple or list, "
+            f"got {type(center).__name__}"
+        )
         raise ValueError(f"{__name__}: {msg}")
 
     if len(center) != 2:
-        msg = f"Circle center tuple must have 2 elements, got {len(center)}"
-        logging.error(msg)
+        msg = f"Circle center must have 2 elements, got {len(center)}"
         raise ValueError(f"{__name__}: {msg}")
 
-    if not all(isinstance(c, (float, int)) for c in center):
+    x, y = center
+    if not (isinstance(x, NUMERIC_TYPES) and isinstance(y, NUMERIC_TYPES)):
         msg = f"Circle center coordinates must be float or int, got {center}"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
     if radius <= 0:
         msg = f"Circle must have a radius > 0, got {radius}"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
 
@@ -113,7 +124,6 @@ def _validate_annulus_circle(
 
     if r_outer <= r_inner:
         msg = f"r_outer must be > r_inner, got {r_outer}, {r_inner}"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
 
@@ -140,28 +150,24 @@ def _validate_annulus_sector(
 
     if start_angle is None or end_angle is None:
         msg = "Annulus sector start and end angles must be defined"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
-    if not isinstance(start_angle, (float, int)):
+    if not isinstance(start_angle, NUMERIC_TYPES):
         msg = (
             "Sector start angle must be float or int, got: "
             f"{type(start_angle).__name__}"
         )
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
-    if not isinstance(end_angle, (float, int)):
+    if not isinstance(end_angle, NUMERIC_TYPES):
         msg = (
             "Sector end angle must be float or int, got: "
             f"{type(end_angle).__name__}"
         )
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
     if r_outer <= r_inner:
         msg = f"r_outer must be > r_inner, got {r_outer}, {r_inner}"
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
     if end_angle <= start_angle:
@@ -169,7 +175,6 @@ def _validate_annulus_sector(
             "end_angle must be > start_angle, got "
             f"{end_angle}, {start_angle}"
         )
-        logging.error(msg)
         raise ValueError(f"{__name__}: {msg}")
 
 
@@ -188,12 +193,10 @@ def _validate_hybrid(
     """
     if edges is None:
         msg = "Hybrid shape must have 'edges' defined."
-        logging.error(msg)
         raise ValueError(msg)
 
     if not isinstance(edges, list):
         msg = f"'edges' must be a list, got {type(edges).__name__}"
-        logging.error(msg)
         raise ValueError(msg)
 
     for i, edge in enumerate(edges):
@@ -203,10 +206,33 @@ def _validate_hybrid(
                 f"Edge {i} has invalid type '{edge_type}', "
                 f"must be one of {list(Connectors)}"
             )
-            logging.error(msg)
             raise ValueError(msg)
 
 
+_VALIDATE_DISPATCH: dict[ShapeType, Callable[[Geometry], None]] = {
+    ShapeType.POLYGON: lambda g: _validate_polygon(g.get("points")),
+    ShapeType.RECTANGLE: lambda g: _validate_polygon(g.get("points")),
+    ShapeType.CIRCLE: lambda g: _validate_circle(
+        g.get("radius"),
+        g.get("center")
+    ),
+    ShapeType.ANNULUS_CIRCLE: lambda g: _validate_annulus_circle(
+        g.get("center"),
+        g.get("radius_outer"),
+        g.get("radius_inner")
+    ),
+    ShapeType.ANNULUS_SECTOR: lambda g: _validate_annulus_sector(
+        g.get("center"),
+        g.get("radius_outer"),
+        g.get("radius_inner"),
+        g.get("start_angle"),
+        g.get("end_angle")
+    ),
+    ShapeType.HYBRID: lambda g: _validate_hybrid(g.get("edges")),
+}
+# Per-shape validators, one dict lookup instead of a match per call.
+
+
 def validate_shape(
     geometry: Geometry
 ) -> None:
@@ -225,38 +251,8 @@ def validate_shape(
         raise ValueError("Geometry dictionary must contain a 'shape' key")
 
     shape = geometry.get("shape")
-    match shape:
-        case ShapeType.POLYGON | ShapeType.RECTANGLE:
-            _validate_polygon(
-                geometry.get("points")
-            )
-
-        case ShapeType.CIRCLE:
-            _validate_circle(
-                geometry.get("radius"),
-                geometry.get("center")
-            )
-
-        case ShapeType.ANNULUS_CIRCLE:
-            _validate_annulus_circle(
-                geometry.get("center"),
-                geometry.get("radius_outer"),
-                geometry.get("radius_inner")
-            )
-
-        case ShapeType.ANNULUS_SECTOR:
-            _validate_annulus_sector(
-                geometry.get("center"),
-                geometry.get("radius_outer"),
-                geometry.get("radius_inner"),
-                geometry.get("start_angle"),
-                geometry.get("end_angle")
-            )
-
-        case ShapeType.HYBRID:
-            _validate_hybrid(
-                geometry.get("edges")
-            )
+    handler = _VALIDATE_DISPATCH.get(shape)
+    if handler is None:
+        raise NotImplementedError(f"Shape '{shape}' not supported")
 
-        case _:
-            raise NotImplementedError(f"Shape '{shape}' not supported")
+    handler(geometry)
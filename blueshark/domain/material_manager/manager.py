@@ -16,11 +16,18 @@ Description:
         here those must be managed within the renderer.
 """
 
+import os
 import tomllib
 
+from copy import deepcopy
 from typing import Optional, Any
 from importlib import resources
 
+_LIBRARY_CACHE: dict[Optional[str], dict[str, Any]] = {}
+# Parsed material libraries keyed by absolute path (None = packaged),
+# so each TOML file is parsed once per process. Every manager works on
+# its own deep copy, the cached parse is never handed out.
+
 
 class MaterialManager:
     """
@@ -44,6 +51,9 @@ class MaterialManager:
         self.used_materials: list[str] = []
         self.materials: dict[str, dict[str, Any]] = {}
 
+        # Lower-cased name -> position in the material list
+        self._index: dict[str, int] = {}
+
         if library_path is None:
             self._load_from_package()
         else:
@@ -81,10 +91,43 @@ class MaterialManager:
             KeyError: if material is not found.
         """
         name_lower = name.lower()
-        for mat in self.materials.get("material", []):
-            if mat["name"].lower() == name_lower:
-                return mat.copy()
-        raise KeyError(f"Material '{name}' not found in library.")
+        material_list = self.materials.get("material", [])
+
+        # Entries are read from the live list, a miss or a position whose
+        # entry no longer has this name (list replaced, edited or renamed
+        # at runtime) rebuilds the index before giving up
+        position = self._index.get(name_lower)
+        if not self._indexed_at(material_list, position, name_lower):
+            self._build_index(material_list)
+            position = self._index.get(name_lower)
+            if position is None:
+                raise KeyError(f"Material '{name}' not found in library.")
+
+        return material_list[position].copy()
+
+    @staticmethod
+    def _indexed_at(
+        material_list: list[dict[str, Any]],
+        position: Optional[int],
+        name_lower: str
+    ) -> bool:
+        """
+        Checks that the indexed position still holds the named material.
+        """
+        return (
+            position is not None
+            and position < len(material_list)
+            and material_list[position]["name"].lower() == name_lower
+        )
+
+    def _build_index(self, material_list: list[dict[str, Any]]) -> None:
+        """
+        Builds the case-insensitive name index of the material list.
+        On duplicate names the first entry wins, as with a linear scan.
+        """
+        self._index = {}
+        for position, mat in enumerate(material_list):
+            self._index.setdefault(mat["name"].lower(), position)
 
     def _apply_parameter(
         self,
@@ -119,10 +162,12 @@ class MaterialManager:
                     )
                     raise ValueError(msg)
 
-                # Apply all grade-dependent properties to magnetic section
-                grade_props = grades[grade_value]
-                for key, value in grade_props.items():
-                    material["magnetic"][key] = value
+                # Apply all grade-dependent properties to a copy of the
+                # magnetic section, the library entry must stay untouched
+                material["magnetic"] = {
+                    **material["magnetic"],
+                    **grades[grade_value]
+                }
 
             case "wire":
 
@@ -137,7 +182,11 @@ class MaterialManager:
                     )
                     raise TypeError(msg)
 
-                material["physical"]["wire_diameter"] = wire_diameter
+                # Copy the physical section so the library is not aliased
+                material["physical"] = {
+                    **material["physical"],
+                    "wire_diameter": wire_diameter
+                }
 
             case "environmental":
                 # Just a flag for specific renderer that need domain conditions
@@ -161,13 +210,18 @@ class MaterialManager:
         """
         Loads the material library that is included in blueshark
         """
+        if None in _LIBRARY_CACHE:
+            self.materials = deepcopy(_LIBRARY_CACHE[None])
+            return
+
         try:
             with resources.open_text(
                 "blueshark.library",
                 "materials.toml"
             ) as file:
                 text = file.read()
-                self.materials = tomllib.loads(text)
+                _LIBRARY_CACHE[None] = tomllib.loads(text)
+                self.materials = deepcopy(_LIBRARY_CACHE[None])
 
         except Exception as error:
             msg = (
@@ -180,9 +234,15 @@ class MaterialManager:
         """
         Loads the user material library from path
         """
+        key = os.path.abspath(path)
+        if key in _LIBRARY_CACHE:
+            self.materials = deepcopy(_LIBRARY_CACHE[key])
+            return
+
         try:
             with open(path, "rb") as file:
-                self.materials = tomllib.load(file)
+                _LIBRARY_CACHE[key] = tomllib.load(file)
+                self.materials = deepcopy(_LIBRARY_CACHE[key])
 
         except Exception as error:
             msg = f"Failed to load material library from '{path}': {error}"
@@ -8,29 +8,59 @@ Description:
     in meters.
 """
 
+from functools import lru_cache
+
 from blueshark.domain.definitions import Units
 from blueshark.domain.constants import (
-    CONVERSION_TO_METERS, PRECISION
+    CONVERSION_TO_METERS, NUMERIC_TYPES, PRECISION
 )
 
 
-def _validate_input(unit: Units, value: float | int) -> None:
+_SQUARE_CONVERSION_TO_METERS = {
+    unit: factor * factor for unit, factor in CONVERSION_TO_METERS.items()
+}
+# Area factors, squared once at import instead of per conversion.
+
+
+@lru_cache(maxsize=None)
+def _unit_factor(unit: Units, square: bool = False) -> float:
     """
-    Validate that the unit is supported and value is a positive number.
+    Validate that the unit is supported and return its factor.
+
+    Cached per (unit, square), so each unit is validated and looked up
+    once for the lifetime of the program.
 
     Args:
         unit: unit type from Units enum
-        value: numeric value to validate
+        square: return the area (square meters) factor; Default False
+
+    Returns:
+        float: conversion factor of the unit
 
     Raises:
-        TypeError: if unit is not of type Units or value is not float/int
-        ValueError: if value is <= 0 or unit is unsupported
+        TypeError: if unit is not of type Units
+        ValueError: if unit is unsupported
     """
     if not isinstance(unit, Units):
         msg = f"Unit must be an instance of Units enum, got {type(unit)}"
         raise TypeError(msg)
 
-    if not isinstance(value, (float, int)):
+    factors = _SQUARE_CONVERSION_TO_METERS if square else CONVERSION_TO_METERS
+    factor = factors.get(unit)
+    if factor is None:
+        raise ValueError(f"Unsupported Unit: {unit}")
+    return factor
+
+
+def _validate_value(value: float | int) -> None:
+    """
+    Validate that the value is a positive number.
+
+    Raises:
+        TypeError: if value is not float/int
+        ValueError: if value is <= 0
+    """
+    if not isinstance(value, NUMERIC_TYPES):
         msg = f"Value must be float or int, got {type(value)}"
         raise TypeError(msg)
 
@@ -38,8 +68,30 @@ def _validate_input(unit: Units, value: float | int) -> None:
         msg = f"Value must be greater than 0, got {value}"
         raise ValueError(msg)
 
-    if unit not in CONVERSION_TO_METERS:
-        raise ValueError(f"Unsupported Unit: {unit}")
+
+def _validate_input(
+    unit: Units,
+    value: float | int,
+    square: bool = False
+) -> float:
+    """
+    Validate that the unit is supported and value is a positive number.
+
+    Args:
+        unit: unit type from Units enum
+        value: numeric value to validate
+        square: look up the area (square meters) factor; Default False
+
+    Returns:
+        float: conversion factor of the unit
+
+    Raises:
+        TypeError: if unit is not of type Units or value is not float/int
+        ValueError: if value is <= 0 or unit is unsupported
+    """
+    factor = _unit_factor(unit, square)
+    _validate_value(value)
+    return factor
 
 
 def convert_to_meters(unit: Units, value: float) -> float:
@@ -49,8 +101,7 @@ def convert_to_meters(unit: Units, value: float) -> float:
     Args:
         value: The numeric value to convert.
     """
-    _validate_input(unit, value)
-    factor = CONVERSION_TO_METERS[unit]
+    factor = _validate_input(unit, value)
     return round(value * factor, PRECISION)
 
 
@@ -61,8 +112,7 @@ def convert_from_meters(unit: Units, value_in_meters: float) -> float:
     Args:
         value_in_meters: The numeric value in meters to convert.
     """
-    _validate_input(unit, value_in_meters)
-    factor = CONVERSION_TO_METERS[unit]
+    factor = _validate_input(unit, value_in_meters)
     return round(value_in_meters / factor, PRECISION)
 
 
@@ -73,9 +123,8 @@ def convert_to_square_meters(unit: Units, value: float) -> float:
     Args:
         value: The numeric area value to convert.
     """
-    _validate_input(unit, value)
-    factor = CONVERSION_TO_METERS[unit]
-    return round(value * (factor ** 2), PRECISION)
+    factor = _validate_input(unit, value, square=True)
+    return round(value * factor, PRECISION)
 
 
 def convert_from_square_meters(
@@ -88,6 +137,9 @@ def convert_from_square_meters(
     Args:
         value_in_square_meters: The numeric area value in square meters.
     """
-    _validate_input(unit, value_in_square_meters)
-    factor = CONVERSION_TO_METERS[unit]
-    return round(value_in_square_meters / (factor ** 2), PRECISION)
+    factor = _validate_input(
+        unit,
+        value_in_square_meters,
+        square=True
+    )
+    return round(value_in_square_meters / factor, PRECISION)
@@ -10,9 +10,9 @@ Description:
 """
 
 import logging
-from math import sqrt
+from math import dist, sqrt
 from typing import Sequence
-from blueshark.domain.constants import PRECISION, EPSILON
+from blueshark.domain.constants import NUMERIC_TYPES, PRECISION, EPSILON
 
 
 def _validate_values(values: Sequence[int | float]) -> None:
@@ -27,8 +27,11 @@ def _validate_values(values: Sequence[int | float]) -> None:
         logging.error(msg)
         raise ValueError(msg)
 
+    if set(map(type, values)).issubset(NUMERIC_TYPES):
+        return
+
     for element in values:
-        if not isinstance(element, (int, float)):
+        if not isinstance(element, NUMERIC_TYPES):
             msg = (
                 f"All elements in the sequence must be int or float, "
                 f"found '{type(element).__name__}'."
@@ -37,6 +40,14 @@ def _validate_values(values: Sequence[int | float]) -> None:
             raise TypeError(msg)
 
 
+def _raw_peak_to_peak(values: Sequence[int | float]) -> float:
+    """
+    Unrounded peak-to-peak of already validated values.
+    """
+    # Subtracting the mean shifts max and min equally, so it cancels
+    return max(values) - min(values)
+
+
 def ripple_peak_to_peak(values: Sequence[int | float]) -> float:
     """
     Compute the peak-to-peak ripple of a numeric sequence.
@@ -48,11 +59,7 @@ def ripple_peak_to_peak(values: Sequence[int | float]) -> float:
         float: Peak-to-peak ripple, rounded to configured precision.
     """
     _validate_values(values)
-
-    mean_value = sum(values) / len(values)
-    ripple = [v - mean_value for v in values]
-    peak_to_peak = max(ripple) - min(ripple)
-    return round(peak_to_peak, PRECISION)
+    return round(_raw_peak_to_peak(values), PRECISION)
 
 
 def ripple_rms(values: Sequence[int | float]) -> float:
@@ -67,9 +74,12 @@ def ripple_rms(values: Sequence[int | float]) -> float:
     """
     _validate_values(values)
 
-    mean_value = sum(values) / len(values)
-    ripple = [v - mean_value for v in values]
-    rms = sqrt(sum(r ** 2 for r in ripple) / len(ripple))
+    count = len(values)
+    mean_value = sum(values) / count
+
+    # Euclidean distance to the constant mean vector is the root of the
+    # summed squared deviations, evaluated in one C-level pass
+    rms = dist(values, [mean_value] * count) / sqrt(count)
     return round(rms, PRECISION)
 
 
@@ -90,5 +100,6 @@ def ripple_percent(values: Sequence[int | float]) -> float:
     if abs(mean_value) < EPSILON:
         return 0.0
 
-    peak_to_peak = ripple_peak_to_peak(values)
+    # Values are already validated, and only the result is rounded
+    peak_to_peak = _raw_peak_to_peak(values)
     return round((peak_to_peak / mean_value) * 100, PRECISION)
@@ -37,5 +37,5 @@ def calculate_volumetric_heating(
         logging.warning(msg)
         raise ValueError(msg)
 
-    qv = (current ** 2) * resistance / volume
+    qv = current * current * resistance / volume
     return round(qv, PRECISION)
@@ -13,6 +13,7 @@ Description:
 
 import logging
 
+from itertools import cycle
 from yaml import safe_load, YAMLError
 from pathlib import Path
 from blueshark.models.tubular.utils import require
@@ -109,10 +110,23 @@ class TubularLinearMotor:
             "enclosed": True
         }
 
+    def _rectangle_center(
+        self,
+        bottom_left: tuple[float, float],
+        width: float,
+        height: float
+    ) -> tuple[float, float]:
+        """
+        Returns the center of a rectangle from its bottom-left vertex,
+        used as the element tag instead of the general polygon centroid.
+        """
+        x, y = bottom_left
+        return (x + 0.5 * width, y + 0.5 * height)
+
     def _compute_geometry(self) -> None:
         """
         Computes key geometric parameters including slot pitch,
-        motor circumference, and pole pitch.
+        motor circumference, pole pitch and the number of slot turns.
         """
         self.slot_pitch = self.slot_axial_length + self.slot_axial_spacing
         self.circumference = self.slot_pitch * self.number_slots
@@ -124,6 +138,14 @@ class TubularLinearMotor:
 
         self.total_number_poles = 4 * self.extra_pairs + self.number_poles
 
+        # Turns within the slot cross section
+        self.slot_turns = estimate_turns(
+            self.slot_thickness,
+            self.slot_axial_length,
+            self.slot_wire_diameter,
+            self.fill_factor
+        )
+
     def _load_material(self) -> None:
         """
         Loads materials into class variables.
@@ -244,17 +266,19 @@ class MagneticPhysics:
 
         motion = LinearMotion(step_size, (PI / 2, 0, 0))
         self.motor.step_size = step_size
-        timeline = []
-        for profile in current_profile:
-            currents = Currents(profile, self.motor.phases)
-            frame = Frame(elements=self.motor.SLOT_ID)
 
-            frame.motion = motion
-            frame.currents = currents
-
-            timeline.append(frame)
-
-        return timeline
+        # Each frame references a row of the cached profile and the shared
+        # motion/phases instead of copying them
+        phases = self.motor.phases
+        slot_id = self.motor.SLOT_ID
+        return [
+            Frame(
+                motion=motion,
+                elements=slot_id,
+                currents=Currents(profile, phases)
+            )
+            for profile in current_profile
+        ]
 
     def _add_boundary(self) -> None:
         """
@@ -281,59 +305,50 @@ class MagneticPhysics:
         This includes the alternating polarity slot with pattern
         """
 
-        # Calculates the slot origins (bottom-left vertex)
-        z = -self.motor.slot_pitch
-        slot_origins = []
-        for slot in range(self.motor.number_slots):
-            # Each slot has spacing except every third one
-            # if slot % 3 != 0:
-            #     z += (
-            #         self.motor.slot_axial_length +
-            #         self.motor.slot_axial_spacing
-            #     )
-            # else:
-            #     z += self.motor.slot_axial_length
-            z += (
-                self.motor.slot_axial_length +
-                self.motor.slot_axial_spacing
-            )
-
-            r = self.motor.slot_inner_radius
-            slot_origins.append((r, z))
-
-        # Calculates turns within the slot cross section
-        number_turns = estimate_turns(
-            self.motor.slot_thickness,
-            self.motor.slot_axial_length,
-            self.motor.slot_wire_diameter,
-            self.motor.fill_factor
+        # Motor parameters read once instead of per slot
+        motor = self.motor
+        pitch = motor.slot_pitch
+        thickness = motor.slot_thickness
+        axial_length = motor.slot_axial_length
+        material = motor.slot_material
+        turns = motor.slot_turns
+        r = motor.slot_inner_radius
+
+        # Calculates the slot origins (bottom-left vertex), one pitch apart
+        # Alternative pattern: no spacing after every third slot
+        # (increment slot_axial_length when slot % 3 == 0)
+        slot_origins = [
+            (r, pitch * slot) for slot in range(motor.number_slots)
+        ]
+
+        # Phase pattern [a, b, c] and alternating polarity per slot
+        slot_phases = cycle(motor.phases)
+        slot_polarities = cycle(
+            (CurrentPolarity.FORWARD, CurrentPolarity.REVERSE)
         )
 
-        for index, origin in enumerate(slot_origins):
-            # Sets phase of slot in pattern [a,b,c]
-            phase = self.motor.phases[index % len(self.motor.phases)]
-
-            # Alternate polarity slot with pattern
-            if index % 2 == 0:
-                polarity = CurrentPolarity.FORWARD
-            else:
-                polarity = CurrentPolarity.REVERSE
-
-            # Draw the slot and assign its physical/material properties
-            slot = self.motor._rectangle_geometry(
-                origin,
-                self.motor.slot_thickness,
-                self.motor.slot_axial_length
+        slots = []
+        for origin, phase, polarity in zip(
+            slot_origins, slot_phases, slot_polarities
+        ):
+            # Slot geometry and its physical/material properties
+            slot = motor._rectangle_geometry(origin, thickness, axial_length)
+            slot_tag = motor._rectangle_center(
+                origin, thickness, axial_length
             )
 
-            self.renderer.draw(
-                slot,
-                self.motor.slot_material,
-                self.motor.SLOT_ID,
-                circuit=phase,
-                turns=number_turns,
-                polarity=polarity
-            )
+            slots.append({
+                "shape": slot,
+                "material": material,
+                "element_id": motor.SLOT_ID,
+                "element_tag": slot_tag,
+                "circuit": phase,
+                "turns": turns,
+                "polarity": polarity
+            })
+
+        # Draws every slot in one batch
+        self.renderer.draw_many(slots)
 
     def _add_stator(self) -> None:
         """
@@ -341,31 +356,41 @@ class MagneticPhysics:
         This includes alternating magnetized poles and the structural tube.
         """
 
+        # Motor parameters read once instead of per pole
+        motor = self.motor
+        pole_pitch = motor.pole_pitch
+        thickness = motor.pole_thickness
+        axial_length = motor.pole_axial_length
+        material = motor.pole_material
+
         # Generate pole origin points, shifted axially by extra pairs
-        pole_origins = []
-        offset = (self.motor.extra_pairs * self.motor.pole_pitch)
-        for pole in range(self.motor.total_number_poles):
-            x = 0
-            y = self.motor.pole_pitch * pole - 2 * offset
-            pole_origins.append((x, y))
+        start = -2 * (motor.extra_pairs * pole_pitch)
+        pole_origins = [
+            (0, pole_pitch * pole + start)
+            for pole in range(motor.total_number_poles)
+        ]
 
+        poles = []
         for index, origin in enumerate(pole_origins):
             # Alternate magnetization direction every pole (e.g., N-S-N-S)
             pole_magnetization = 90 if index % 2 == 0 else -90
 
-            # Draw the poles and assign its physical/material properties
-            pole = self.motor._rectangle_geometry(
-                origin,
-                self.motor.pole_thickness,
-                self.motor.pole_axial_length
+            # Pole geometry and its physical/material properties
+            pole = motor._rectangle_geometry(origin, thickness, axial_length)
+            pole_tag = motor._rectangle_center(
+                origin, thickness, axial_length
             )
 
-            self.renderer.draw(
-                pole,
-                self.motor.pole_material,
-                self.motor.POLE_ID,
-                magnetization=pole_magnetization
-            )
+            poles.append({
+                "shape": pole,
+                "material": material,
+                "element_id": motor.POLE_ID,
+                "element_tag": pole_tag,
+                "magnetization": pole_magnetization
+            })
+
+        # Draws every pole in one batch
+        self.renderer.draw_many(poles)
 
         # Compute the tube height and origin based on all poles combined
         tube_axial_length = (
@@ -381,10 +406,16 @@ class MagneticPhysics:
             self.motor.tube_thickness,
             tube_axial_length
         )
+        tube_tag = self.motor._rectangle_center(
+            tube_origin,
+            self.motor.tube_thickness,
+            tube_axial_length
+        )
         self.renderer.draw(
             tube,
             self.motor.tube_material,
-            self.motor.TUBE_ID
+            self.motor.TUBE_ID,
+            element_tag=tube_tag
         )
 
     def _create_circuits(self) -> None:
@@ -8,8 +8,6 @@ Description:
     mechanical and electrical angles.
 """
 
-import logging
-
 from blueshark.domain.constants import PRECISION, TWO_PI
 
 
@@ -29,11 +27,14 @@ def mechanical_angle(circumference: float, displacement: float) -> float:
     """
     if circumference <= 0:
         msg = f"Circumference must be > 0, got {circumference}"
-        logging.error(msg)
         raise ValueError(msg)
 
     angle = (TWO_PI * displacement) / circumference
-    return round(angle % TWO_PI, PRECISION)
+
+    # Most displacements are already within one revolution
+    if not 0 <= angle < TWO_PI:
+        angle %= TWO_PI
+    return angle
 
 
 def electrical_angle(num_pole_pairs: int, mech_angle: float) -> float:
@@ -52,7 +53,25 @@ def electrical_angle(num_pole_pairs: int, mech_angle: float) -> float:
     """
     if num_pole_pairs <= 0:
         msg = f"Number of pole pairs must be > 0, got {num_pole_pairs}"
-        logging.error(msg)
         raise ValueError(msg)
 
-    return round((mech_angle * num_pole_pairs) % TWO_PI, PRECISION)
+    angle = mech_angle * num_pole_pairs
+    if not 0 <= angle < TWO_PI:
+        angle %= TWO_PI
+    return angle
+
+
+def round_angle(angle: float) -> float:
+    """
+    Round an angle to the configured PRECISION for display or output.
+
+    The angle functions return unrounded values, since cos/sin of the
+    result do not benefit from quantization.
+
+    Args:
+        angle: Angle in radians.
+
+    Returns:
+        float: Angle rounded to PRECISION.
+    """
+    return round(angle, PRECISION)
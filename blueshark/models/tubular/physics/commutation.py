@@ -8,24 +8,118 @@ Description:
     for 3-phase tubular linear motor.
 """
 
-from blueshark.models.tubular.physics.transforms import (
-    inverse_clarke_transform, inverse_park_transform
-)
-from blueshark.models.tubular.physics.angles import (
-    electrical_angle, mechanical_angle
+from functools import lru_cache
+from math import cos, sin
+
+from blueshark.domain.constants import (
+    COMMUTATION_CACHE_SIZE, COMMUTATION_RESEED, HALF_SQRT3, PRECISION, TWO_PI
 )
 
 
+def _dq_to_abc_coefficients(
+    d_current: float,
+    q_current: float
+) -> tuple[tuple[float, float], ...]:
+    """
+    Folds the inverse Park and inverse Clarke transforms for fixed d-q
+    currents into per-phase (cos, sin) coefficients, so that each phase
+    current is cos_coef * cos(theta) + sin_coef * sin(theta).
+
+    Args:
+        d_current: Current in the d-axis.
+        q_current: Current in the q-axis.
+
+    Returns:
+        Coefficient pairs for phases (a, b, c).
+    """
+    return (
+        (d_current, -q_current),
+        (
+            -0.5 * d_current + HALF_SQRT3 * q_current,
+            HALF_SQRT3 * d_current + 0.5 * q_current
+        ),
+        (
+            -0.5 * d_current - HALF_SQRT3 * q_current,
+            -HALF_SQRT3 * d_current + 0.5 * q_current
+        ),
+    )
+
+
+@lru_cache(maxsize=COMMUTATION_CACHE_SIZE)
+def _commutation_core(
+    pole_pairs: int,
+    d_current: float,
+    q_current: float,
+    num_samples: int,
+    phase_offset: float
+) -> tuple[tuple[float, float, float], ...]:
+    """
+    Computes the phase currents for each sample of one electrical sweep.
+
+    The profile only depends on these arguments (the circumference
+    cancels out of the angle step), so it is memoized for sweeps that
+    vary the motor geometry but keep the drive settings.
+
+    Args:
+        pole_pairs: Number of magnetic pole pairs
+        d_current: Peak d-axis current
+        q_current: Peak q-axis current
+        num_samples: Number of sampling points.
+        phase_offset: Electrical angle offset (in radians)
+
+    Returns:
+        Tuple of (a, b, c) phase currents, num_samples + 1 entries.
+    """
+    # Same steps as mechanical_angle -> electrical_angle ->
+    # inverse_park_transform -> inverse_clarke_transform, rounding once
+    # at the end instead of after every stage. The electrical angle is
+    # linear in the step and only used through cos/sin, so the
+    # [0, 2pi) wrapping of both angle stages is not needed.
+    elec_per_step = TWO_PI * pole_pairs / num_samples
+    (a_cos, a_sin), (b_cos, b_sin), (c_cos, c_sin) = _dq_to_abc_coefficients(
+        d_current, q_current
+    )
+
+    # cos/sin advance by the angle-addition formulas; every
+    # COMMUTATION_RESEED steps they are re-evaluated exactly so the
+    # round-off of the recurrence cannot accumulate.
+    cos_step = cos(elec_per_step)
+    sin_step = sin(elec_per_step)
+
+    profile = []
+    for step in range(num_samples + 1):
+        if step % COMMUTATION_RESEED == 0:
+            elec_angle = elec_per_step * step + phase_offset
+            cos_e = cos(elec_angle)
+            sin_e = sin(elec_angle)
+        else:
+            cos_e, sin_e = (
+                cos_e * cos_step - sin_e * sin_step,
+                sin_e * cos_step + cos_e * sin_step
+            )
+
+        profile.append((
+            round(a_cos * cos_e + a_sin * sin_e, PRECISION),
+            round(b_cos * cos_e + b_sin * sin_e, PRECISION),
+            round(c_cos * cos_e + c_sin * sin_e, PRECISION)
+        ))
+
+    return tuple(profile)
+
+
 def commutation(
     circumference: float,
     pole_pairs: int,
     currents_peak: tuple[float, float],
     num_samples: int,
     phase_offset: float = 0.0
-) -> tuple[float, list[tuple[float, float, float]]]:
+) -> tuple[float, tuple[tuple[float, float, float], ...]]:
     """
     Generates the commutation current profile
 
+    The profile is returned as the shared, immutable tuple from the
+    profile cache, so repeated calls do not rebuild or copy it.
+
     Args:
         circumference: Circumference of the motor
         pole_pairs: Number of magnetic pole pairs
@@ -59,17 +153,12 @@ def commutation(
         )
 
     step_size = circumference / num_samples
-    profile: list[tuple[float, float, float]] = []
-
-    for step in range(num_samples + 1):
-        mech_angle = mechanical_angle(circumference, step * step_size)
-        elec_angle = electrical_angle(pole_pairs, mech_angle) + phase_offset
-
-        alpha, beta = inverse_park_transform(
-            currents_peak[0], currents_peak[1], elec_angle
-        )
-        pa, pb, pc = inverse_clarke_transform(alpha, beta)
-
-        profile.append((pa, pb, pc))
+    profile = _commutation_core(
+        pole_pairs,
+        currents_peak[0],
+        currents_peak[1],
+        num_samples,
+        phase_offset
+    )
 
     return step_size, profile
@@ -8,7 +8,6 @@ Description:
     or square slot/coils.
 """
 
-import logging
 from math import ceil
 
 
@@ -33,17 +32,11 @@ def estimate_turns(
     """
     if length <= 0 or height <= 0 or wire_diameter <= 0:
         msg = "All dimensions must be positive and non-zero."
-        logging.error(msg)
         raise ValueError(msg)
 
     if not (0 < fill_factor <= 1):
         msg = "Fill factor must be between 0 and 1."
-        logging.error(msg)
         raise ValueError(msg)
 
-    slot_area = length * height
-    wire_area = wire_diameter ** 2
-    effective_area = slot_area * fill_factor
-
-    turns = effective_area / wire_area
-    return ceil(turns)
+    turns_per_area = fill_factor / (wire_diameter * wire_diameter)
+    return ceil(length * height * turns_per_area)
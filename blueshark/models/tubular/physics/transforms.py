@@ -8,8 +8,36 @@ Description:
     tubular motor reference frames.
 """
 
-from math import cos, sin, sqrt
-from blueshark.domain.constants import PRECISION
+from math import cos, sin
+from blueshark.domain.constants import HALF_SQRT3, PRECISION
+
+
+def _raw_inverse_park_transform(
+    d_current: float,
+    q_current: float,
+    elec_angle: float
+) -> tuple[float, float]:
+    """
+    Unrounded inverse Park transform, for composing with further math.
+    """
+    cos_e = cos(elec_angle)
+    sin_e = sin(elec_angle)
+
+    alpha = d_current * cos_e - q_current * sin_e
+    beta = d_current * sin_e + q_current * cos_e
+    return alpha, beta
+
+
+def _raw_inverse_clarke_transform(
+    alpha: float,
+    beta: float
+) -> tuple[float, float, float]:
+    """
+    Unrounded inverse Clarke transform, for composing with further math.
+    """
+    half_sqrt3_beta = HALF_SQRT3 * beta
+    half_alpha = 0.5 * alpha
+    return alpha, half_sqrt3_beta - half_alpha, -half_sqrt3_beta - half_alpha
 
 
 def inverse_park_transform(
@@ -30,10 +58,9 @@ def inverse_park_transform(
         Result: Currents in alpha and beta stationary reference
                 frame, rounded to configured PRECISION.
     """
-
-    alpha = d_current * cos(elec_angle) - q_current * sin(elec_angle)
-    beta = d_current * sin(elec_angle) + q_current * cos(elec_angle)
-
+    alpha, beta = _raw_inverse_park_transform(
+        d_current, q_current, elec_angle
+    )
     return round(alpha, PRECISION), round(beta, PRECISION)
 
 
@@ -53,8 +80,10 @@ def inverse_clarke_transform(
         results: Three-phase currents (a, b, c),
                 rounded to configured PRECISION.
     """
+    phase_a, phase_b, phase_c = _raw_inverse_clarke_transform(alpha, beta)
+    return (
+        round(phase_a, PRECISION),
+        round(phase_b, PRECISION),
+        round(phase_c, PRECISION)
+    )
 
-    phase_a = round(alpha, PRECISION)
-    phase_b = round(0.5 * (sqrt(3) * beta - alpha), PRECISION)
-    phase_c = round(0.5 * (-sqrt(3) * beta - alpha), PRECISION)
-    return phase_a, phase_b, phase_c
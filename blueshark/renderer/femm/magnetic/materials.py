@@ -13,6 +13,14 @@ import femm
 
 from typing import Any
 
+_FEMM_LAMINATION = {
+    "solid": 0,
+    "laminated_x": 1,
+    "laminated_y": 2,
+    "magnet_wire": 3,
+}
+# FEMM lamination/wire type code for each material lamination name.
+
 
 def femm_add_material(material: dict[str, Any]) -> None:
     """
@@ -33,17 +41,13 @@ def femm_add_material(material: dict[str, Any]) -> None:
     wire_diameter = physical_data.get("wire_diameter", 0.0)
     number_of_strands = 1 if wire_diameter > 0 else 0
 
-    match lamination:
-        case "solid":        femm_lamination = 0
-        case "laminated_x":  femm_lamination = 1
-        case "laminated_y":  femm_lamination = 2
-        case "magnet_wire":  femm_lamination = 3
-        case _:
-            femm_lamination = 0
-            msg = (
-                f"'{lamination}' not supported by FEMM; defaulting to 'solid'"
-            )
-            logging.warning(msg)
+    femm_lamination = _FEMM_LAMINATION.get(lamination)
+    if femm_lamination is None:
+        femm_lamination = 0
+        msg = (
+            f"'{lamination}' not supported by FEMM; defaulting to 'solid'"
+        )
+        logging.warning(msg)
 
     relative_permeability = magnetic_data.get(
         "relative_permeability",
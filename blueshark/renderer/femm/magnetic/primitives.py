@@ -38,31 +38,19 @@ def _draw_polygon(
         Connectors.ARC: []
     }
 
-    pairs = len(points) - 1
-
-    # Connects vertex pairs together
-    for i in range(pairs):
-        contours[Connectors.LINE].append(
-            mid_points_line(points[i], points[i + 1])
-        )
-        femm.mi_drawline(
-            points[i][0],
-            points[i][1],
-            points[i + 1][0],
-            points[i + 1][1]
-        )
+    # Connects vertex pairs together, walking the previous vertex
+    # instead of indexing points[i] and points[i + 1]
+    start = points[0]
+    for end in points[1:]:
+        contours[Connectors.LINE].append(mid_points_line(start, end))
+        femm.mi_drawline(start[0], start[1], end[0], end[1])
+        start = end
 
     if enclosed:
-        contours[Connectors.LINE].append(
-            mid_points_line(points[-1], points[0])
-        )
+        end = points[0]
+        contours[Connectors.LINE].append(mid_points_line(start, end))
         # Connects first and last vertex
-        femm.mi_drawline(
-            points[-1][0],
-            points[-1][1],
-            points[0][0],
-            points[0][1]
-        )
+        femm.mi_drawline(start[0], start[1], end[0], end[1])
 
     return contours
 
@@ -90,7 +90,8 @@ def add_circuit(
 
 def assign_element_id(
     contours: dict[Connectors, tuple[float, float]],
-    element_id: int
+    element_id: int,
+    clear: bool = True
 ) -> None:
     """
     Assigns a element id to the contours of a shape
@@ -98,14 +99,17 @@ def assign_element_id(
     Args:
         contours: ShapeType object containing line and arc segments
         element_id: element id to assign to individual contours
+        clear: Clear the selection afterwards; callers that clear it
+               themselves (e.g. set_element_properties) can skip it
     """
 
-    # Assign element id to line segments
+    # FEMM applies mi_setgroup to the whole selection, so every contour
+    # is selected first and the group is set with a single call.
+
+    # Select line segments
     try:
         for segment in contours[Connectors.LINE]:
             femm.mi_selectsegment(segment[0], segment[1])
-            femm.mi_setgroup(element_id)
-            femm.mi_clearselected()
     except Exception as e:
         msg = (
             "Failed to add assign elements to line segments "
@@ -113,12 +117,10 @@ def assign_element_id(
         )
         raise RuntimeError(msg) from e
 
-    # Assign element id to arc segment:
+    # Select arc segments
     try:
         for segment in contours[Connectors.ARC]:
             femm.mi_selectarcsegment(segment[0], segment[1])
-            femm.mi_setgroup(element_id)
-            femm.mi_clearselected()
     except Exception as e:
         msg = (
             "Failed to add assign elements to arc segments "
@@ -126,6 +128,18 @@ def assign_element_id(
         )
         raise RuntimeError(msg) from e
 
+    # Assign element id to the selected contours
+    try:
+        femm.mi_setgroup(element_id)
+        if clear:
+            femm.mi_clearselected()
+    except Exception as e:
+        msg = (
+            "Failed to add assign elements to segments "
+            f"in FEMMagneticRenderer {e}"
+        )
+        raise RuntimeError(msg) from e
+
 
 def assign_boundary(
     contours: dict[Connectors, tuple[float, float]],
@@ -139,10 +153,15 @@ def assign_boundary(
         boundary: boundary name to assign to individual contours
     """
 
+    # Each property call applies to every selected segment of its kind,
+    # so a selection pass per kind replaces per-segment set/clear calls.
+
     # Assign boundary to line segments
+    lines = contours[Connectors.LINE]
     try:
-        for segment in contours[Connectors.LINE]:
+        for segment in lines:
             femm.mi_selectsegment(segment[0], segment[1])
+        if lines:
             femm.mi_setsegmentprop(boundary, 0, 0, 0, 0)
             femm.mi_clearselected()
     except Exception as e:
@@ -153,9 +172,11 @@ def assign_boundary(
         raise RuntimeError(msg) from e
 
     # Assign boundary to arc segment:
+    arcs = contours[Connectors.ARC]
     try:
-        for segment in contours[Connectors.ARC]:
+        for segment in arcs:
             femm.mi_selectarcsegment(segment[0], segment[1])
+        if arcs:
             femm.mi_setarcsegmentprop(0, boundary, 0, 0)
             femm.mi_clearselected()
     except Exception as e:
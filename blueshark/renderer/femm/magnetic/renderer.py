@@ -12,10 +12,12 @@ Description:
 """
 
 import logging
+import shutil
 import femm
 
+from dataclasses import replace
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Sequence
 from math import cos, sin, degrees
 
 from blueshark.renderer.renderer_interface import MagneticRenderer
@@ -41,6 +43,20 @@ from blueshark.renderer.femm.magnetic.primitives import (
     draw_primitive
 )
 
+_FEMM_PROBLEM_TYPES = {
+    CoordinateSystem.AXI_SYMMETRIC: "axi",
+    CoordinateSystem.PLANAR: "planar",
+}
+# FEMM problem type for each supported coordinate system.
+
+_FEMM_UNITS = {
+    Units.MICROMETERS: "micrometers",
+    Units.MILLIMETER: "millimeters",
+    Units.CENTIMETERS: "centimeters",
+    Units.METER: "meters",
+}
+# FEMM length unit names for each supported unit.
+
 
 class FEMMagneticRenderer(MagneticRenderer):
     """
@@ -88,36 +104,23 @@ class FEMMagneticRenderer(MagneticRenderer):
         if depth < 0 or frequency < 0:
             raise ValueError("Depth and frequency must be non-negative")
 
-        problem_type = None
-        if system == CoordinateSystem.AXI_SYMMETRIC:
-            problem_type = "axi"
-            if depth != 0:
-                msg = (
-                    "Axial Symmetric simulations don't have depth, "
-                    f"got {depth}; defaulting to depth = 0"
-                )
-                logging.warning(msg)
-                depth = 0
-        elif system == CoordinateSystem.PLANAR:
-            problem_type = "planar"
-        else:
+        problem_type = _FEMM_PROBLEM_TYPES.get(system)
+        if problem_type is None:
             msg = f"{system} isn't supported by FEMMagneticRenderer"
             raise ValueError(msg)
 
-        femm_units = None
-        match units:
-            case Units.MICROMETERS:
-                femm_units = "micrometers"
-            case Units.CENTIMETERS:
-                femm_units = "centimeters"
-            case Units.MILLIMETER:
-                femm_units = "millimeters"
-            case Units.METER:
-                femm_units = "meters"
-
-            case _:
-                msg = f"Unit '{units}' is not supported by FEMM"
-                raise NotImplementedError(msg)
+        if problem_type == "axi" and depth != 0:
+            msg = (
+                "Axial Symmetric simulations don't have depth, "
+                f"got {depth}; defaulting to depth = 0"
+            )
+            logging.warning(msg)
+            depth = 0
+
+        femm_units = _FEMM_UNITS.get(units)
+        if femm_units is None:
+            msg = f"Unit '{units}' is not supported by FEMM"
+            raise NotImplementedError(msg)
 
         try:
             # Ensures the users file path exists
@@ -179,13 +182,56 @@ class FEMMagneticRenderer(MagneticRenderer):
             turns: [Optional] Number of turns of material within the element
             magnetization: [Optional] Directionally of the magnetic field
         """
+        self._draw_element(
+            shape,
+            material,
+            element_id,
+            element_tag,
+            circuit,
+            polarity,
+            turns,
+            magnetization
+        )
+
+        self.save_changes()
+
+    def draw_many(self, elements: Iterable[dict[str, Any]]) -> None:
+        """
+        Draws several elements and saves the FEMM file once,
+        instead of after every element.
+
+        Args:
+            elements: keyword arguments of draw() for each element
+        """
+        for element in elements:
+            self._draw_element(**element)
+
+        self.save_changes()
+
+    def _draw_element(
+        self,
+        shape: Geometry,
+        material: dict[str, Any],
+        element_id: int,
+        element_tag: Optional[tuple[float, float]] = None,
+        circuit: Optional[str] = None,
+        polarity: CurrentPolarity = CurrentPolarity.FORWARD,
+        turns: int = 1,
+        magnetization: float = 0.0
+    ) -> None:
+        """
+        Draws an element and sets its properties without saving,
+        see draw() for the arguments.
+        """
         self._check_active()
         contours = draw_primitive(shape)
 
-        # Assign element identifier to contours
+        # Assign element identifier to contours; the selection is cleared
+        # by set_element_properties below
         assign_element_id(
             contours,
-            element_id
+            element_id,
+            clear=False
         )
 
         # adds material to simulation space
@@ -221,8 +267,6 @@ class FEMMagneticRenderer(MagneticRenderer):
             magnetization
         )
 
-        self.save_changes()
-
     def draw_domain_boundary(
         self,
         shape: Geometry,
@@ -292,6 +336,39 @@ class FEMMagneticRenderer(MagneticRenderer):
 
         self.save_changes()
 
+    def change_circuit_currents(
+        self,
+        circuits: Sequence[str],
+        currents: Sequence[float]
+    ) -> None:
+        """
+        Changes the currents of several circuits and saves once,
+        instead of saving the FEMM file after every circuit.
+
+        Args:
+            circuits: circuit names
+            currents: New current values in amps, one per circuit
+        """
+        self._check_active()
+        pairs = list(zip(circuits, currents, strict=True))
+
+        unknown = [
+            circuit for circuit, _ in pairs if circuit not in self.circuits
+        ]
+        if unknown:
+            msg = f"{unknown} haven't been initiated within the renderer"
+            raise RuntimeError(msg)
+
+        for circuit, current in pairs:
+            try:
+                femm.mi_setcurrent(circuit, current)
+            except Exception as e:
+                msg = f"Failed to set current {current} A on '{circuit}': {e}"
+                logging.critical(msg)
+                raise RuntimeError(f"{self.__class__.__name__}: {msg}") from e
+
+        self.save_changes()
+
     def move_element(
         self,
         element_ids: int | list[int],
@@ -321,16 +398,17 @@ class FEMMagneticRenderer(MagneticRenderer):
 
         theta = angles[0]
 
+        dx = magnitude * cos(theta)
+        dy = magnitude * sin(theta)
+
         # Ensure we have a list
         if not isinstance(element_ids, (list, tuple)):
             elements_to_move = [element_ids]
         else:
             elements_to_move = element_ids
 
-        dx = magnitude * cos(theta)
-        dy = magnitude * sin(theta)
-
-        # Select each block individually and move
+        # mi_selectgroup replaces the selection, so each group is
+        # selected, moved and cleared on its own
         for element in elements_to_move:
             femm.mi_selectgroup(element)
             femm.mi_movetranslate(dx, dy)
@@ -422,6 +500,47 @@ class FEMMagneticRenderer(MagneticRenderer):
 
         self.save_changes()
 
+    def copy(self, file_path: Path) -> "FEMMagneticRenderer":
+        """
+        Copies the drawn problem to a new file and returns a renderer
+        for it, so sweep points that only change currents or positions
+        reuse the drawn model instead of re-drawing it.
+
+        Args:
+            file_path: path to the copied renderer file
+
+        Returns:
+            FEMMagneticRenderer: renderer for the copy, with the same
+                                 problem, materials and circuits
+        """
+        file_path = Path(file_path)
+        if file_path.resolve() == self.file_path.resolve():
+            msg = f"Copy must use a different file path, got {file_path}"
+            raise ValueError(msg)
+
+        # Flush pending edits so the file on disk is the full model, then
+        # release FEMM; either renderer reopens its own file when used
+        if self.is_active:
+            self.save_changes()
+            self.clean_up()
+
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self.file_path, file_path)
+
+        except OSError as e:
+            msg = f"Failed to copy {self.file_path} to {file_path}: {e}"
+            logging.critical(msg)
+            raise RuntimeError(f"{self.__class__.__name__}: {msg}") from e
+
+        variant = FEMMagneticRenderer(file_path)
+        variant.materials = set(self.materials)
+        variant.circuits = set(self.circuits)
+        variant.problem = replace(self.problem)
+        variant.original_tolerance = self.original_tolerance
+
+        return variant
+
     def save_changes(self) -> None:
         """
         Manages the changes to the femm file
@@ -13,7 +13,7 @@ Description:
 """
 
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Sequence
 from abc import ABC, abstractmethod
 
 from blueshark.domain.constants import SETUP_CURRENT
@@ -116,6 +116,14 @@ class MagneticRenderer(BaseRenderer, ABC):
         Draw shape with given material and element_id
         """
 
+    def draw_many(self, elements: Iterable[dict[str, Any]]) -> None:
+        """
+        Draws several elements, each given as keyword arguments of draw().
+        Renderers may override this to draw them in one batch.
+        """
+        for element in elements:
+            self.draw(**element)
+
     @abstractmethod
     def create_circuit(
         self,
@@ -138,6 +146,19 @@ class MagneticRenderer(BaseRenderer, ABC):
         Changes the current flowing through a circuit
         """
 
+    def change_circuit_currents(
+        self,
+        circuits: Sequence[str],
+        currents: Sequence[float]
+    ) -> None:
+        """
+        Changes the currents of several circuits, e.g. every phase of a
+        commutation step. Renderers may override this to apply them in
+        one batch.
+        """
+        for circuit, current in zip(circuits, currents, strict=True):
+            self.change_circuit_current(circuit, current)
+
 
 class ThermalRenderer(BaseRenderer, ABC):
     """
@@ -70,11 +70,10 @@ def _step_magnetic(
     """
     if frame.currents is None:
         return
-    for i, val in enumerate(frame.currents.values):
-        renderer.change_circuit_current(
-            frame.currents.circuits[i],
-            val
-        )
+    renderer.change_circuit_currents(
+        frame.currents.circuits,
+        frame.currents.values
+    )
 
 
 def quasi_transient(
@@ -0,0 +1,77 @@
+"""
+Filename: sweep.py
+Author: William Bowley
+Version: 1.4
+Date: 2026-10-15
+
+Description:
+    Runs independent working points of a
+    parameter sweep in parallel processes.
+
+    Responsibilities:
+    - Distributes working points over a process pool
+    - Returns results in the order of the working points
+"""
+
+import logging
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Optional, TypeVar
+
+Point = TypeVar("Point")
+
+
+def parallel_sweep(
+    run_point: Callable[[Point], Any],
+    points: Iterable[Point],
+    workers: Optional[int] = None,
+    chunksize: int = 1
+) -> list[Any]:
+    """
+    Evaluates independent working points in a pool of processes.
+
+    Each worker process drives its own FEMM instance, so run_point
+    must build its renderer and solve on its own (e.g. renderer setup
+    followed by static_simulation) and write to a file path unique
+    to the point. Frames of a quasi_transient simulation depend on the
+    previous frame and must not be split across points.
+
+    Args:
+        run_point: Module-level (picklable) function solving one point
+        points: Working points passed to run_point
+        workers: Number of processes; Default os.cpu_count()
+        chunksize: Points handed to a worker at a time; Default 1
+
+    returns:
+        results: run_point result for each point, in input order
+    """
+    if not callable(run_point):
+        msg = f"run_point must be callable, got '{run_point}'"
+        raise TypeError(msg)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if not isinstance(workers, int) or workers <= 0:
+        msg = f"Workers must be a positive integer, got '{workers}'"
+        raise ValueError(msg)
+
+    if not isinstance(chunksize, int) or chunksize <= 0:
+        msg = f"Chunksize must be a positive integer, got '{chunksize}'"
+        raise ValueError(msg)
+
+    points = list(points)
+
+    try:
+        # Nothing to distribute, skip the process start-up cost
+        if workers == 1 or len(points) <= 1:
+            return [run_point(point) for point in points]
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run_point, points, chunksize=chunksize))
+
+    except Exception as e:
+        msg = f"Parallel sweep failed with {workers} workers: {e}"
+        logging.critical(msg)
+        raise RuntimeError(msg) from e
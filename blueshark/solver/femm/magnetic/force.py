@@ -10,10 +10,28 @@ Description:
 
 import math
 
-from blueshark.domain.constants import PRECISION
+from blueshark.domain.constants import PRECISION, RAD_TO_DEG
 from blueshark.solver.femm.magnetic import utils
 
 
+def _resultant(fx: float, fy: float) -> tuple[float, float]:
+    """
+    Converts force components to a rounded (magnitude, angle) pair,
+    with the angle in degrees [0, 360).
+    """
+    magnitude = math.hypot(fx, fy)
+    angle = math.atan2(fy, fx) * RAD_TO_DEG
+
+    # Only the lower half-plane (and -0.0) needs shifting into [0, 360);
+    # a shift that rounds up to exactly 360 wraps to 0
+    if angle <= 0.0:
+        angle += 360.0
+        if angle >= 360.0:
+            angle = 0.0
+
+    return round(magnitude, PRECISION), round(angle, PRECISION)
+
+
 def lorentz(element_id: int) -> tuple[float, float]:
     """
     Calculates the Lorentz force on a given element.
@@ -27,13 +45,8 @@ def lorentz(element_id: int) -> tuple[float, float]:
         (rounded to configured precision)
     """
 
-    fx = utils.get_block_integral(element_id, 11)
-    fy = utils.get_block_integral(element_id, 12)
-
-    magnitude = math.hypot(fx, fy)
-    angle = (math.degrees(math.atan2(fy, fx)) + 360) % 360
-
-    return round(magnitude, PRECISION), round(angle, PRECISION)
+    fx, fy = utils.get_block_integrals(element_id, (11, 12))
+    return _resultant(fx, fy)
 
 
 def weighted_stress_tensor(element_id: int) -> tuple[float, float]:
@@ -49,10 +62,5 @@ def weighted_stress_tensor(element_id: int) -> tuple[float, float]:
         (rounded to configured precision)
     """
 
-    fx = utils.get_block_integral(element_id, 18)
-    fy = utils.get_block_integral(element_id, 19)
-
-    magnitude = math.hypot(fx, fy)
-    angle = (math.degrees(math.atan2(fy, fx)) + 360) % 360
-
-    return round(magnitude, PRECISION), round(angle, PRECISION)
+    fx, fy = utils.get_block_integrals(element_id, (18, 19))
+    return _resultant(fx, fy)
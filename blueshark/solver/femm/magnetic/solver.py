@@ -20,6 +20,7 @@ from typing import Union, Any
 from blueshark.solver.solver_interface import BaseSolver
 from blueshark.renderer.femm.magnetic.renderer import FEMMagneticRenderer
 from blueshark.solver.femm.magnetic.output_selector import FEMMagneticSelector
+from blueshark.solver.femm.magnetic.utils import solution_cache
 from blueshark.domain.constants import (
     MAXIMUM_TOLERANCE, MAXIMUM_FAILS
 )
@@ -99,10 +100,13 @@ class FEMMagneticSolver(BaseSolver):
                 tolerance *= 10
                 self._change_tolerance(tolerance)
 
-        outputs = self.selector.compute(
-            elements=self.subjects.get("elements"),
-            circuits=self.subjects.get("circuits")
-        )
+        # Outputs sharing circuit properties or block integrals read them
+        # from FEMM once; the cache is dropped with this solution
+        with solution_cache():
+            outputs = self.selector.compute(
+                elements=self.subjects.get("elements"),
+                circuits=self.subjects.get("circuits")
+            )
 
         # Resets the tolerance to user tolerance for next step
         self._change_tolerance(self.original_tolerance)
@@ -10,6 +10,40 @@ Description:
 import logging
 import femm
 
+from contextlib import contextmanager
+from typing import Iterator
+
+_CIRCUIT_CACHE: dict[str, tuple[float, float, float]] = {}
+# Circuit properties of the loaded solution, one FEMM call per circuit.
+
+_BLOCK_INTEGRAL_CACHE: dict[tuple[int, int], float] = {}
+# Block integrals of the loaded solution, keyed by (element_id, type).
+
+_cache_enabled = False
+# Caches are only used inside solution_cache(), outside it FEMM is queried.
+
+
+@contextmanager
+def solution_cache() -> Iterator[None]:
+    """
+    Caches circuit properties and block integrals of the loaded
+    solution for the duration of the block.
+
+    The caches start empty and are cleared on exit, so cached values
+    never outlive the solution they were read from.
+    """
+    global _cache_enabled
+    _CIRCUIT_CACHE.clear()
+    _BLOCK_INTEGRAL_CACHE.clear()
+    _cache_enabled = True
+
+    try:
+        yield
+    finally:
+        _cache_enabled = False
+        _CIRCUIT_CACHE.clear()
+        _BLOCK_INTEGRAL_CACHE.clear()
+
 
 def get_circuit_properties(
     circuit_name: str
@@ -18,6 +52,8 @@ def get_circuit_properties(
     Safely retrieves the properties of a specified circuit from FEMM.
 
     This helper function handles all error logging and exceptions.
+    Inside solution_cache() results are cached per circuit, so the
+    circuit outputs share one FEMM round-trip per solution.
 
     Args:
         circuit_name: The name of the circuit.
@@ -31,8 +67,13 @@ def get_circuit_properties(
         logging.error(msg)
         raise ValueError(msg)
 
+    if _cache_enabled and circuit_name in _CIRCUIT_CACHE:
+        return _CIRCUIT_CACHE[circuit_name]
+
     try:
-        circuit_props = femm.mo_getcircuitproperties(circuit_name)
+        circuit_props = tuple(femm.mo_getcircuitproperties(circuit_name))
+        if _cache_enabled:
+            _CIRCUIT_CACHE[circuit_name] = circuit_props
         return circuit_props
     except Exception as e:
         msg = f"Failed to get properties from circuit '{circuit_name}': {e}"
@@ -40,27 +81,20 @@ def get_circuit_properties(
         raise RuntimeError(msg) from e
 
 
-def get_block_integral(
-    element_id: int,
-    integral_type: int
-) -> float:
+def _check_element_id(element_id: int) -> None:
     """
-    Safely calculates a block integral on a specified element.
-
-    This helper function handles all error logging and exceptions.
-
-    Args:
-        element_id: Element identifier
-        integral_type: The type of integral to compute (ref. pyfemm doc).
-
-    Returns:
-        result: The result of the block integral.
+    Checks the element identifier is a positive integer.
     """
     if not isinstance(element_id, int) or element_id <= 0:
         msg = f"Group must be a positive integer, got {element_id}."
         logging.error(msg)
         raise ValueError(msg)
 
+
+def _check_integral_type(integral_type: int) -> None:
+    """
+    Checks the block integral type is a valid pyFEMM integral code.
+    """
     if not isinstance(integral_type, int):
         msg = f"Integral type must be an integer, got {integral_type}."
         logging.error(msg)
@@ -76,14 +110,73 @@ def get_block_integral(
         logging.error(msg)
         raise ValueError(msg)
 
+
+def get_block_integral(
+    element_id: int,
+    integral_type: int
+) -> float:
+    """
+    Safely calculates a block integral on a specified element.
+
+    This helper function handles all error logging and exceptions.
+
+    Args:
+        element_id: Element identifier
+        integral_type: The type of integral to compute (ref. pyfemm doc).
+
+    Returns:
+        result: The result of the block integral.
+    """
+    return get_block_integrals(element_id, (integral_type,))[0]
+
+
+def get_block_integrals(
+    element_id: int,
+    integral_types: tuple[int, ...]
+) -> tuple[float, ...]:
+    """
+    Safely calculates several block integrals on a specified element,
+    selecting and clearing the element's blocks only once.
+
+    This helper function handles all error logging and exceptions.
+    Inside solution_cache() results are cached per (element_id,
+    integral_type), so outputs sharing an integral (e.g. force and
+    torque on the same element) reuse it.
+
+    Args:
+        element_id: Element identifier
+        integral_types: The types of integral to compute (ref. pyfemm doc).
+
+    Returns:
+        results: The block integral results, in integral_types order.
+    """
+    _check_element_id(element_id)
+    for integral_type in integral_types:
+        _check_integral_type(integral_type)
+
+    # Outside solution_cache() the results only live for this call
+    results = _BLOCK_INTEGRAL_CACHE if _cache_enabled else {}
+    missing = [
+        integral_type for integral_type in integral_types
+        if (element_id, integral_type) not in results
+    ]
+
     try:
-        femm.mo_groupselectblock(element_id)
-        result = femm.mo_blockintegral(integral_type)
-        femm.mo_clearblock()
-        return result
+        if missing:
+            femm.mo_groupselectblock(element_id)
+            for integral_type in missing:
+                results[element_id, integral_type] = (
+                    femm.mo_blockintegral(integral_type)
+                )
+            femm.mo_clearblock()
+
+        return tuple(
+            results[element_id, integral_type]
+            for integral_type in integral_types
+        )
     except Exception as e:
         msg = (
-            f"Failed to calculate block integral of type {integral_type} "
+            f"Failed to calculate block integrals of types {integral_types} "
             f"for element id {element_id}: {e}"
         )
         logging.critical(msg)
@@ -10,13 +10,18 @@ Description:
 
 import unittest
 
-from math import sqrt
-from blueshark.domain.constants import PRECISION, PI
+from decimal import Decimal
+from math import cos, sin, sqrt
+from blueshark.domain.constants import PRECISION, PI, DEG_TO_RAD
 from blueshark.domain.geometry.area import calculate_area
+from blueshark.domain.geometry.cache import (
+    _cached_call, clear_geometry_cache
+)
 from blueshark.domain.geometry.validation import validate_shape
 from blueshark.domain.geometry.graphical_centroid import centroid_point
 from blueshark.domain.geometry.utils import (
-    mid_points_arc, mid_points_line, find_arc_center,
+    mid_points_arc, mid_points_line,
+    find_arc_center,
     scale_geometry, _scale_polygon
 )
 
@@ -29,6 +34,13 @@ class ShapeArea(unittest.TestCase):
     """
     Tests the calculate area function in the geometry module
     """
+    def setUp(self) -> None:
+        """
+        Starts each test with an empty kernel cache, so results are
+        computed instead of reused from earlier tests
+        """
+        clear_geometry_cache()
+
     def test_standard_circle(self) -> None:
         """
         Tests standard use case of a circle
@@ -99,6 +111,56 @@ class ShapeArea(unittest.TestCase):
         result = calculate_area(geometry)
         self.assertEqual(result, expected)
 
+    def test_repeated_call_after_mutation(self) -> None:
+        """
+        Tests that a cached area is not reused once the geometry changes
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.POLYGON,
+            "points": [(0, 0), (2, 0), (2, 2), (0, 2)]
+        }
+        self.assertEqual(calculate_area(geometry), 4)
+        self.assertEqual(calculate_area(geometry), 4)
+
+        geometry["points"][2] = (2, 4)
+        expected = round(6, PRECISION)
+        result = calculate_area(geometry)
+        self.assertEqual(result, expected)
+
+    def test_repeated_hybrid_after_mutation(self) -> None:
+        """
+        Tests that cached hybrid vertices are not reused once edges change
+        """
+        edges: list[Connection] = [
+            {"type": Connectors.LINE, "start": (0, 0), "end": (0, 5)},
+            {"type": Connectors.LINE, "start": (0, 5), "end": (5, 5)},
+            {"type": Connectors.LINE, "start": (5, 5), "end": (5, 0)},
+        ]
+        geometry: Geometry = {
+            "shape": ShapeType.HYBRID,
+            "edges": edges
+        }
+        self.assertEqual(calculate_area(geometry), 25)
+        self.assertEqual(centroid_point(geometry), (2.5, 2.5))
+
+        edges[2]["start"] = (5, 10)
+        edges[1]["end"] = (5, 10)
+        expected = round(37.5, PRECISION)
+        result = calculate_area(geometry)
+        self.assertEqual(result, expected)
+
+    def test_high_precision_polygon(self) -> None:
+        """
+        Tests compensated summation agrees on a standard polygon
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.POLYGON,
+            "points": [(0, 0), (3, 0.1), (3.3, 2.7), (0.2, 3.1)]
+        }
+        expected = calculate_area(geometry)
+        result = calculate_area(geometry, high_precision=True)
+        self.assertEqual(result, expected)
+
     def test_non_supported_shape(self) -> None:
         """
         invalid shape as input to test resilience of the function
@@ -153,6 +215,30 @@ class GraphicalCentroid(unittest.TestCase):
     Tests the calculate graphical centroid of a shape in
     geometry module
     """
+    def setUp(self) -> None:
+        """
+        Starts each test with an empty kernel cache, so results are
+        computed instead of reused from earlier tests
+        """
+        clear_geometry_cache()
+
+    def test_area_and_centroid_share_moments(self) -> None:
+        """
+        Tests the centroid reuses the polygon pass of the area
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.POLYGON,
+            "points": [(1, 1), (9, 2), (8, 7), (2, 6)]
+        }
+
+        calculate_area(geometry)
+        before = _cached_call.cache_info()
+        centroid_point(geometry)
+        after = _cached_call.cache_info()
+
+        self.assertEqual(after.hits - before.hits, 1)
+        self.assertEqual(after.misses, before.misses)
+
     def test_standard_circle(self) -> None:
         """
         Tests standard use case of a circle
@@ -233,6 +319,23 @@ class GraphicalCentroid(unittest.TestCase):
         result = centroid_point(geometry)
         self.assertEqual(result, expected)
 
+    def test_repeated_call_after_mutation(self) -> None:
+        """
+        Tests that a cached centroid is not reused once the geometry changes
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.ANNULUS_CIRCLE,
+            "radius_outer": 10.0,
+            "radius_inner": 2.0,
+            "center": (0, 0)
+        }
+        self.assertEqual(centroid_point(geometry), (0, 6.0))
+
+        geometry["center"] = (1, 1)
+        expected = (1, 7.0)
+        result = centroid_point(geometry)
+        self.assertEqual(result, expected)
+
     def test_same_points_polygon(self) -> None:
         """
         Invalid shape as a point doesn't have area and
@@ -273,6 +376,18 @@ class ValidateShape(unittest.TestCase):
 
         validate_shape(geometry)
 
+    def test_list_center_circle(self) -> None:
+        """
+        Tests a circle center given as a list, as polygon vertices are
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.CIRCLE,
+            "center": [0, 0],
+            "radius": 5.0
+        }
+
+        validate_shape(geometry)
+
     def test_standard_polygon(self) -> None:
         """
         Tests standard use case of a polygon but off-axis
@@ -352,6 +467,60 @@ class ValidateShape(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_shape(geometry)
 
+    def test_polygon_with_list_vertices(self) -> None:
+        """
+        Polygon vertices given as lists are accepted like tuples
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.POLYGON,
+            "points": [[0, 0], [5.0, 0], (5, 5), [0, 5]]
+        }
+        validate_shape(geometry)
+        self.assertEqual(calculate_area(geometry), 25)
+
+    def test_polygon_with_invalid_vertex(self) -> None:
+        """
+        Invalid polygon as one vertex has a non-numeric coordinate
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.POLYGON,
+            "points": [(0, 0), (5.0, 0), (5, 5), (0, "5")]
+        }
+
+        with self.assertRaises(ValueError):
+            validate_shape(geometry)
+
+    def test_revalidate_after_mutation(self) -> None:
+        """
+        A shape that passed validation fails once it is made invalid
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.CIRCLE,
+            "radius": 5.0,
+            "center": (0, 0)
+        }
+        validate_shape(geometry)
+        validate_shape(geometry)
+
+        geometry["radius"] = -5.0
+        with self.assertRaises(ValueError):
+            validate_shape(geometry)
+
+    def test_equal_value_of_other_type(self) -> None:
+        """
+        A value equal to an already validated one is still type checked
+        """
+        geometry: Geometry = {
+            "shape": ShapeType.CIRCLE,
+            "radius": 5,
+            "center": (0, 0)
+        }
+        validate_shape(geometry)
+
+        geometry["radius"] = Decimal(5)
+        with self.assertRaises(ValueError):
+            validate_shape(geometry)
+
     def test_polygon_with_one_point(self) -> None:
         """
         Invalid polygon as it only has one point
@@ -411,6 +580,37 @@ class MidPoints(unittest.TestCase):
         )
         self.assertEqual(result, expected)
 
+    def test_arc_across_negative_x_axis(self) -> None:
+        """
+        Tests the shorter arc is used when the angles wrap around pi
+        """
+        start_point = (-10, 1)
+        end_point = (-10, -1)
+        center = (0, 0)
+
+        expected = (round(-sqrt(101), PRECISION), 0)
+        result = mid_points_arc(start_point, end_point, center)
+        self.assertEqual(result, expected)
+
+    def test_half_circle_arc_segment(self) -> None:
+        """
+        Tests a 180 degree arc takes the counter-clockwise midpoint
+        """
+        start_angle = 2 * DEG_TO_RAD
+        end_angle = 182 * DEG_TO_RAD
+        start_point = (20 * cos(start_angle), 20 * sin(start_angle))
+        end_point = (20 * cos(end_angle), 20 * sin(end_angle))
+        center = (0, 0)
+
+        mid_angle = 92 * DEG_TO_RAD
+        expected = (
+            round(20 * cos(mid_angle), PRECISION),
+            round(20 * sin(mid_angle), PRECISION)
+        )
+        result = mid_points_arc(start_point, end_point, center)
+        self.assertAlmostEqual(result[0], expected[0], places=9)
+        self.assertAlmostEqual(result[1], expected[1], places=9)
+
     def test_invalid_line_segment(self) -> None:
         """
         Invalid line segment with (x,y,z) instead of (x,y)
@@ -432,6 +632,17 @@ class MidPoints(unittest.TestCase):
         with self.assertRaises(TypeError):
             mid_points_arc(start_point, end_point, center)
 
+    def test_arc_point_on_center(self) -> None:
+        """
+        Invalid arc segment as its end point lies on the center
+        """
+        start_point = (0, 10)
+        end_point = (0, 0)
+        center = (0, 0)
+
+        with self.assertRaises(ValueError):
+            mid_points_arc(start_point, end_point, center)
+
 
 class FindCenterArc(unittest.TestCase):
     """
@@ -73,6 +73,22 @@ class ManagerTest(unittest.TestCase):
         )
         self.assertEqual(expected, result)
 
+    def test_replaced_material(self) -> None:
+        """
+        Tests lookup after a material entry is replaced in place
+        """
+        manager = MaterialManager(CUSTOM_LIBRARY)
+        manager.use_material("UNIT_TEST_MATERIAL")
+
+        replaced = copy.deepcopy(unit_test_material)
+        replaced["name"] = "REPLACED_MATERIAL"
+        manager.materials["material"][0] = replaced
+
+        result = manager.use_material("replaced_material")
+        self.assertEqual(result["name"], "REPLACED_MATERIAL")
+        with self.assertRaises(KeyError):
+            manager.use_material("UNIT_TEST_MATERIAL")
+
     def test_apply_parameter_wire(self) -> None:
         """
         Tests that a wire material correctly applies
@@ -97,6 +113,46 @@ class ManagerTest(unittest.TestCase):
 
         self.assertEqual(expected, result)
 
+    def test_library_not_mutated(self) -> None:
+        """
+        Tests that applying parameters does not alter the loaded library
+        """
+        test_material = copy.deepcopy(unit_test_material)
+        test_material['tag'] = "wire"
+        manager = MaterialManager()
+        manager.materials["material"].append(test_material)
+
+        first = manager.use_material("UNIT_TEST_MATERIAL", wire_diameter=0.6)
+        second = manager.use_material("UNIT_TEST_MATERIAL", wire_diameter=1.2)
+
+        self.assertEqual(first["physical"]["wire_diameter"], 0.6)
+        self.assertEqual(second["physical"]["wire_diameter"], 1.2)
+        self.assertEqual(test_material["physical"]["wire_diameter"], 0)
+
+    def test_shared_library_isolated(self) -> None:
+        """
+        Tests that runtime additions stay local to one manager
+        """
+        first = MaterialManager()
+        first.materials["material"].append(unit_test_material)
+        second = MaterialManager()
+
+        with self.assertRaises(KeyError):
+            second.use_material("UNIT_TEST_MATERIAL")
+
+    def test_shared_library_not_aliased(self) -> None:
+        """
+        Tests that editing a returned material does not leak into
+        a new manager
+        """
+        first = MaterialManager(CUSTOM_LIBRARY)
+        material = first.use_material("UNIT_TEST_MATERIAL")
+        material["physical"]["lamination_fill"] = "POISONED"
+
+        second = MaterialManager(CUSTOM_LIBRARY)
+        material = second.use_material("UNIT_TEST_MATERIAL")
+        self.assertEqual(material["physical"]["lamination_fill"], 1.0)
+
     def test_apply_parameter_magnet(self) -> None:
         """
         Tests that a magnetic material correctly applies a grade parameter
@@ -15,7 +15,7 @@ from blueshark.models.tubular.physics.number_turns import (
     estimate_turns
 )
 from blueshark.models.tubular.physics.angles import (
-    electrical_angle, mechanical_angle
+    electrical_angle, mechanical_angle, round_angle
 )
 from blueshark.models.tubular.physics.transforms import (
     inverse_clarke_transform,
@@ -37,19 +37,19 @@ class TestMechanical(unittest.TestCase):
 
     def test_half_circumference(self):
         expected = round(pi, PRECISION)
-        self.assertEqual(mechanical_angle(10, 5), expected)
+        self.assertEqual(round_angle(mechanical_angle(10, 5)), expected)
 
     def test_displacement_greater_than_circumference(self):
         # displacement 15 with circumference 10 -> same as displacement 5
         expected = round(pi, PRECISION)
-        self.assertEqual(mechanical_angle(10, 15), expected)
+        self.assertEqual(round_angle(mechanical_angle(10, 15)), expected)
 
     def test_fractional_displacement(self):
         circumference = 20
         displacement = 2.5
         expected = round(pi / 4, PRECISION)
         actual = mechanical_angle(circumference, displacement)
-        self.assertEqual(actual, expected)
+        self.assertEqual(round_angle(actual), expected)
 
 
 class TestElectrical(unittest.TestCase):
@@ -101,6 +101,22 @@ class TestCommutation(unittest.TestCase):
         self.assertEqual(len(profile), 3)
         self.assertAlmostEqual(step_size, 0.5)
 
+    def test_matches_transforms(self):
+        step_size, profile = commutation(
+            circumference=3.0,
+            pole_pairs=2,
+            currents_peak=(0.5, 2.0),
+            num_samples=12,
+            phase_offset=0.3
+        )
+        for step, phases in enumerate(profile):
+            mech = mechanical_angle(3.0, step * step_size)
+            elec = electrical_angle(2, mech) + 0.3
+            alpha, beta = inverse_park_transform(0.5, 2.0, elec)
+            expected = inverse_clarke_transform(alpha, beta)
+            for result, value in zip(phases, expected):
+                self.assertAlmostEqual(result, value, places=10)
+
     def test_invalid_samples(self):
         with self.assertRaises(ValueError):
             commutation(1.0, 1, (1.0, 0.0), 0)
@@ -0,0 +1,68 @@
+"""
+File: test_femm_magnetic.py
+Author: William Bowley
+Version: 1.4
+Date: 2026-10-15
+
+Description:
+    Tests the FEMM calls made by renderer/femm/magnetic,
+    with femm replaced by a mock
+"""
+
+import importlib
+import sys
+import unittest
+
+from math import pi
+from unittest import mock
+
+
+class MoveElement(unittest.TestCase):
+    """
+    Tests FEMMagneticRenderer.move_element
+    """
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.femm = mock.MagicMock()
+        with mock.patch.dict(sys.modules, {"femm": cls.femm}):
+            module = importlib.import_module(
+                "blueshark.renderer.femm.magnetic.renderer"
+            )
+        cls.renderer_cls = module.FEMMagneticRenderer
+
+    def setUp(self) -> None:
+        self.femm.reset_mock()
+        self.renderer = self.renderer_cls("unit_test.fem")
+        self.renderer.is_active = True
+
+    def test_every_group_translated(self) -> None:
+        """
+        Tests each group is selected, translated and cleared in turn
+        """
+        self.renderer.move_element([1, 2, 3], 2.0, (0, 0, 0))
+
+        expected = []
+        for element in [1, 2, 3]:
+            expected += [
+                mock.call.mi_selectgroup(element),
+                mock.call.mi_movetranslate(2.0, 0.0),
+                mock.call.mi_clearselected()
+            ]
+
+        calls = [
+            call for call in self.femm.mock_calls
+            if call[0] != "mi_saveas"
+        ]
+        self.assertEqual(calls, expected)
+        self.femm.mi_saveas.assert_called_once()
+
+    def test_single_group(self) -> None:
+        """
+        Tests a single element id is moved along the angle
+        """
+        self.renderer.move_element(4, 1.0, (pi / 2, 0, 0))
+
+        self.femm.mi_selectgroup.assert_called_once_with(4)
+        dx, dy = self.femm.mi_movetranslate.call_args[0]
+        self.assertAlmostEqual(dx, 0.0)
+        self.assertAlmostEqual(dy, 1.0)
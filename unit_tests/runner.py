@@ -9,6 +9,8 @@ Description:
     - domain/test_generation
     - domain/test_physics
     - domain/test_material_manager
+    - simulate/test_sweep
+    - renderer/test_femm_magnetic
 """
 
 import unittest
@@ -16,6 +18,8 @@ import domain.test_geometry as test_gen
 import domain.test_physics as test_phy
 import domain.test_material_manager as test_mm
 import modules.tubular.test_physics as tub_phy
+import simulate.test_sweep as test_sweep
+import renderer.test_femm_magnetic as test_femm_mag
 
 loader = unittest.TestLoader()
 suite = unittest.TestSuite()
@@ -44,6 +48,12 @@ suite.addTests(loader.loadTestsFromTestCase(tub_phy.TestCommutation))
 suite.addTests(loader.loadTestsFromTestCase(tub_phy.TestTransforms))
 suite.addTests(loader.loadTestsFromTestCase(tub_phy.TestNumberTurns))
 
+# simulate/test_sweep
+suite.addTests(loader.loadTestsFromTestCase(test_sweep.ParallelSweep))
+
+# renderer/test_femm_magnetic
+suite.addTests(loader.loadTestsFromTestCase(test_femm_mag.MoveElement))
+
 runner = unittest.TextTestRunner(verbosity=2)
 
 if __name__ == "__main__":
@@ -0,0 +1,82 @@
+"""
+File: test_sweep.py
+Author: William Bowley
+Version: 1.4
+Date: 2026-10-15
+
+Description:
+    Tests functions within simulate/sweep
+"""
+
+import unittest
+
+from blueshark.simulate.sweep import parallel_sweep
+
+
+def _square(point: float) -> float:
+    """
+    Module-level working point, so it can be sent to a worker process
+    """
+    return point * point
+
+
+def _fail(point: float) -> float:
+    """
+    Module-level working point that raises inside the worker process
+    """
+    raise ArithmeticError(f"cannot solve point {point}")
+
+
+class ParallelSweep(unittest.TestCase):
+    """
+    Tests the parallel sweep function
+    """
+    def test_serial_sweep(self) -> None:
+        """
+        Tests a single worker solves the points in order without a pool
+        """
+        points = [3, 1, 2]
+
+        expected = [9, 1, 4]
+        result = parallel_sweep(_square, points, workers=1)
+        self.assertEqual(result, expected)
+
+    def test_parallel_sweep(self) -> None:
+        """
+        Tests a process pool returns the results in input order
+        """
+        points = [3, 1, 2]
+
+        expected = [9, 1, 4]
+        result = parallel_sweep(_square, points, workers=2)
+        self.assertEqual(result, expected)
+
+    def test_parallel_worker_failure(self) -> None:
+        """
+        Tests an exception raised in a worker is wrapped as RuntimeError
+        """
+        with self.assertRaises(RuntimeError) as context:
+            parallel_sweep(_fail, [1, 2], workers=2)
+
+        self.assertIsInstance(context.exception.__cause__, ArithmeticError)
+
+    def test_single_point(self) -> None:
+        """
+        Tests a single working point skips the process pool
+        """
+        result = parallel_sweep(_square, iter([5]), workers=4)
+        self.assertEqual(result, [25])
+
+    def test_zero_workers(self) -> None:
+        """
+        Zero workers is rejected instead of using every CPU
+        """
+        with self.assertRaises(ValueError):
+            parallel_sweep(_square, [1, 2], workers=0)
+
+    def test_invalid_run_point(self) -> None:
+        """
+        Invalid working point function as it is not callable
+        """
+        with self.assertRaises(TypeError):
+            parallel_sweep("not callable", [1, 2])